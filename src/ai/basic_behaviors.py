@@ -48,11 +48,12 @@ class BasicBehaviors:
             preferred_houses = available_houses
         
         # Prefer blessed houses (higher weight)
+        rng = world.rng
         blessed_houses = [h for h in preferred_houses if h.is_blessed()]
-        if blessed_houses and random.random() < 0.7:  # 70% chance to prefer blessed
-            return random.choice(blessed_houses)
+        if blessed_houses and rng.random() < 0.7:  # 70% chance to prefer blessed
+            return rng.choice(blessed_houses)
         
-        return random.choice(preferred_houses)
+        return rng.choice(preferred_houses)
     
     @staticmethod
     def should_visit_house(kid: Kid, house: House) -> bool:
@@ -330,30 +331,27 @@ class BasicBehaviors:
             kid: Kid entity seeking to trade
             world: GameWorld instance
         """
-        # Get nearby kids from spatial grid
-        nearby_kids = world.spatial_grid.get_nearby(kid.position, 150.0)
-        
-        # Filter to valid trading partners
-        valid_partners = []
-        for other_kid in nearby_kids:
-            if not isinstance(other_kid, Kid):
-                continue
-            if other_kid == kid:
-                continue
-            if not other_kid.active:
-                continue
-            if other_kid.state == KidState.IN_TRADE:
-                continue  # Don't interrupt ongoing trades
-            if not other_kid.inventory:
-                continue  # Must have candy
-            valid_partners.append(other_kid)
-        
-        if not valid_partners:
-            kid.state = KidState.IDLE
-            return
-        
-        # Pick a random partner
-        partner = random.choice(valid_partners)
+        trade_radius = 150.0
+        
+        # Warm start: retry the last partner who accepted, if still viable,
+        # before scanning the neighborhood
+        partner = kid.last_trade_partner
+        if not (partner is not None and
+                BasicBehaviors._is_valid_trade_partner(kid, partner) and
+                kid.position.distance_squared_to(partner.position) <= trade_radius * trade_radius):
+            # Get nearby kids from spatial grid
+            nearby_kids = world.spatial_grid.get_nearby(kid.position, trade_radius)
+            
+            # Filter to valid trading partners
+            valid_partners = [other_kid for other_kid in nearby_kids
+                              if BasicBehaviors._is_valid_trade_partner(kid, other_kid)]
+            
+            if not valid_partners:
+                kid.state = KidState.IDLE
+                return
+            
+            # Pick a random partner
+            partner = random.choice(valid_partners)
         
         # Generate a simple 1-for-1 trade proposal
         trade_offer, trade_request = BasicBehaviors._generate_trade_proposal(kid, partner)
@@ -366,13 +364,31 @@ class BasicBehaviors:
         if world.economy:
             partner_score = partner.evaluate_trade(trade_offer, trade_request, world.economy)
             
-            # If partner accepts, execute the trade
+            # If partner accepts, execute the trade and remember them
             if partner_score > 0:
                 BasicBehaviors._execute_trade(kid, partner, trade_offer, trade_request, world)
                 kid.trade_cooldown = 3.0  # 3 second cooldown
+                kid.last_trade_partner = partner
+            else:
+                kid.last_trade_partner = None
         
         kid.state = KidState.IDLE
     
+    @staticmethod
+    def _is_valid_trade_partner(kid: Kid, other_kid) -> bool:
+        """Check whether another entity can currently trade with a kid."""
+        if not isinstance(other_kid, Kid):
+            return False
+        if other_kid is kid:
+            return False
+        if not other_kid.active:
+            return False
+        if other_kid.state == KidState.IN_TRADE:
+            return False  # Don't interrupt ongoing trades
+        if not other_kid.inventory:
+            return False  # Must have candy
+        return True
+    
     @staticmethod
     def _generate_trade_proposal(kid: Kid, partner: Kid):
         """
@@ -509,7 +525,7 @@ class BasicBehaviors:
         # Visual effects for trade
         BasicBehaviors._emit_trade_effects(kid, partner, offer, request, world)
         
-        # Record in kid's recent trades
+        # Record in kid's recent trades (bounded deques drop the oldest)
         kid.recent_trades.append({
             "partner": partner.id,
             "offer": offer.copy(),
@@ -521,12 +537,6 @@ class BasicBehaviors:
             "request": offer.copy()
         })
         
-        # Keep only last 10 trades
-        if len(kid.recent_trades) > 10:
-            kid.recent_trades.pop(0)
-        if len(partner.recent_trades) > 10:
-            partner.recent_trades.pop(0)
-        
         print(f"Trade: {kid.id} <-> {partner.id}")
     
     @staticmethod
@@ -6,7 +6,6 @@ around houses and other obstacles in the world.
 """
 
 import heapq
-import time
 from typing import List, Tuple, Optional, Dict, Set
 from ..utils.vector2 import Vector2
 from ..core.config_manager import config_manager
@@ -67,6 +66,9 @@ class PathfindingGrid:
         
         # Obstacles (houses, etc.)
         self.obstacles: Set[Tuple[int, int]] = set()
+        # Bumped whenever the obstacle set changes, so cached paths can be
+        # invalidated by whoever planned them
+        self.obstacles_version = 0
     
     def world_to_grid(self, world_pos: Vector2) -> Tuple[int, int]:
         """Convert world position to grid coordinates."""
@@ -120,6 +122,8 @@ class PathfindingGrid:
                     distance = ((dx * self.cell_size) ** 2 + (dy * self.cell_size) ** 2) ** 0.5
                     if distance <= radius:
                         self.obstacles.add((x, y))
+        
+        self.obstacles_version += 1
     
     def remove_obstacle(self, world_pos: Vector2, radius: float = 20):
         """Remove an obstacle at a world position."""
@@ -135,6 +139,8 @@ class PathfindingGrid:
                     distance = ((dx * self.cell_size) ** 2 + (dy * self.cell_size) ** 2) ** 0.5
                     if distance <= radius:
                         self.obstacles.discard((x, y))
+        
+        self.obstacles_version += 1
     
     def get_neighbors(self, node: PathNode) -> List[PathNode]:
         """Get walkable neighbors of a node."""
@@ -171,8 +177,10 @@ class Pathfinder:
     
     def __init__(self, grid: PathfindingGrid):
         self.grid = grid
-        self.path_cache: Dict[Tuple, Tuple[List[Vector2], float]] = {}
-        self.cache_lifetime = 5.0  # seconds
+        # (start cell, end cell) -> path, or None when no path exists. A* works
+        # on cells, so the result for a cell pair only changes with obstacles.
+        self.path_cache: Dict[Tuple[int, int, int, int], Optional[List[Vector2]]] = {}
+        self._cache_version = grid.obstacles_version
     
     def find_path(self, start: Vector2, end: Vector2) -> Optional[List[Vector2]]:
         """
@@ -183,15 +191,9 @@ class Pathfinder:
             end: Ending position in world coordinates
             
         Returns:
-            List of waypoints in world coordinates, or None if no path found
+            List of waypoints in world coordinates, or None if no path found.
+            Paths are shared between callers through the cache; do not mutate them.
         """
-        # Check cache first
-        cache_key = (int(start.x), int(start.y), int(end.x), int(end.y))
-        if cache_key in self.path_cache:
-            path, timestamp = self.path_cache[cache_key]
-            if time.time() - timestamp < self.cache_lifetime:
-                return path
-        
         # Convert to grid coordinates
         start_grid = self.grid.world_to_grid(start)
         end_grid = self.grid.world_to_grid(end)
@@ -199,11 +201,20 @@ class Pathfinder:
         if not self.grid.is_valid_position(*start_grid) or not self.grid.is_valid_position(*end_grid):
             return None
         
+        # Check cache first (misses are cached too, since a failed search
+        # explores the whole reachable grid)
+        if self._cache_version != self.grid.obstacles_version:
+            self.clear_cache()
+        cache_key = start_grid + end_grid
+        if cache_key in self.path_cache:
+            return self.path_cache[cache_key]
+        
         # Get start and end nodes
         start_node = self.grid.grid[start_grid[1]][start_grid[0]]
         end_node = self.grid.grid[end_grid[1]][end_grid[0]]
         
         if not start_node.walkable or not end_node.walkable:
+            self.path_cache[cache_key] = None
             return None
         
         # A* algorithm
@@ -225,7 +236,7 @@ class Pathfinder:
                 # Found path, reconstruct it
                 path = self._reconstruct_path(current)
                 # Cache the result
-                self.path_cache[cache_key] = (path, time.time())
+                self.path_cache[cache_key] = path
                 return path
             
             closed_set.add(current)
@@ -249,6 +260,7 @@ class Pathfinder:
                         heapq.heappush(open_set, neighbor)
         
         # No path found
+        self.path_cache[cache_key] = None
         return None
     
     def _heuristic(self, node_a: PathNode, node_b: PathNode) -> float:
@@ -274,11 +286,14 @@ class Pathfinder:
     def clear_cache(self):
         """Clear the path cache."""
         self.path_cache.clear()
+        self._cache_version = self.grid.obstacles_version
     
     def update_obstacles(self, houses: List):
         """Update obstacles based on current houses."""
-        # Clear existing obstacles
+        # Clear existing obstacles, and the paths planned around them
         self.grid.obstacles.clear()
+        self.grid.obstacles_version += 1
+        self.clear_cache()
         
         # Add houses as obstacles
         for house in houses:
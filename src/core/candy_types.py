@@ -4,6 +4,7 @@ Candy type definitions and visual properties.
 Defines candy types, their properties, and visual representations.
 """
 
+import sys
 from typing import Dict, Tuple, Optional
 from ..core.config_manager import config_manager
 
@@ -76,6 +77,8 @@ class CandyTypes:
             candy_config = config_manager.get('candy_types')
             if candy_config:
                 for candy_key, properties in candy_config.items():
+                    # Candy keys are used in every inventory/belief dict lookup
+                    candy_key = sys.intern(candy_key)
                     name = properties.get('name', candy_key.title())
                     real_value = properties.get('real_value', 5.0)
                     decay_rate = properties.get('decay_rate', 0.01)
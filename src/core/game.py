@@ -7,7 +7,7 @@ Handles initialization, main game loop, and coordination between systems.
 import pygame
 from typing import Optional, Dict, Any
 
-from .constants import SCREEN_SIZE, FPS_TARGET, COLORS
+from .constants import SCREEN_SIZE, FPS_TARGET, COLORS, GAME_TIME_STEP
 from .game_state import GameState, GameStateMachine, BaseState
 from .config_manager import config_manager
 from ..systems.game_world import GameWorld
@@ -50,6 +50,7 @@ class Game:
         # Game state
         self.delta_time = 0.0
         self.game_time = 0.0
+        self.time_accumulator = 0.0  # Unsimulated frame time for fixed-step updates
         
         print("Candy Capitalism initialized successfully")
     
@@ -58,7 +59,7 @@ class Game:
         # For now, just register placeholder states
         # These will be implemented in later sprints
         self.state_machine.register_state(GameState.MAIN_MENU, MainMenuState())
-        self.state_machine.register_state(GameState.PLAYING, PlayingState())
+        self.state_machine.register_state(GameState.PLAYING, PlayingState(self.clock))
         self.state_machine.register_state(GameState.PAUSED, PausedState())
     
     def run(self):
@@ -74,8 +75,11 @@ class Game:
             # Handle events
             self._handle_events()
             
-            # Update game state
-            self.state_machine.update(self.delta_time)
+            # Update game state in fixed steps so simulation is independent of frame rate
+            self.time_accumulator += self.delta_time
+            while self.time_accumulator >= GAME_TIME_STEP:
+                self.state_machine.update(GAME_TIME_STEP)
+                self.time_accumulator -= GAME_TIME_STEP
             
             # Render
             self._render()
@@ -163,10 +167,11 @@ class MainMenuState(BaseState):
 class PlayingState(BaseState):
     """Playing state with world and rendering."""
     
-    def __init__(self):
+    def __init__(self, clock: Optional[pygame.time.Clock] = None):
         self.world = GameWorld()
         self.renderer = None
         self.initialized = False
+        self.clock = clock  # Game loop clock, for the debug overlay's FPS
         
         # UI elements
         self.particle_system = ParticleSystem()
@@ -198,7 +203,7 @@ class PlayingState(BaseState):
     def on_enter(self, data=None):
         print("Entered playing state")
         if not self.initialized:
-            self.renderer = Renderer(pygame.display.get_surface())
+            self.renderer = Renderer(pygame.display.get_surface(), self.clock)
             
             # Add UI systems to renderer for trade effects
             self.renderer.particle_system = self.particle_system
@@ -5,6 +5,8 @@ Provides common functionality for position, velocity, update/render hooks,
 and basic entity management.
 """
 
+import sys
+from math import cos, sin, sqrt
 from typing import Optional, Any
 from ..utils.vector2 import Vector2
 
@@ -19,6 +21,14 @@ class BaseEntity:
     - Basic entity identification
     """
     
+    # Entities are created in large numbers, so store attributes in slots
+    # rather than a per-instance __dict__
+    __slots__ = (
+        'id', 'position', 'velocity', 'rotation', 'scale',
+        '_rot_cached', '_fwd_cached', '_right_cached',
+        'active', 'visible', 'last_update_time',
+    )
+    
     def __init__(self, entity_id: str, position: Vector2 = None):
         """
         Initialize base entity.
@@ -27,12 +37,17 @@ class BaseEntity:
             entity_id: Unique identifier for this entity
             position: Initial position (defaults to origin)
         """
-        self.id = entity_id
+        self.id = sys.intern(entity_id)  # IDs key many dicts and sets
         self.position = position or Vector2(0, 0)
         self.velocity = Vector2(0, 0)
         self.rotation = 0.0  # In radians
         self.scale = 1.0
         
+        # Direction vectors cached for the last rotation they were computed at
+        self._rot_cached: Optional[float] = None
+        self._fwd_cached = Vector2(1, 0)
+        self._right_cached = Vector2(0, 1)
+        
         # Entity state
         self.active = True
         self.visible = True
@@ -50,8 +65,12 @@ class BaseEntity:
         if not self.active:
             return
             
-        # Update position based on velocity
-        self.position += self.velocity * dt
+        # Update position based on velocity (most entities are at rest, so
+        # skip the Vector2 temporaries entirely when there is nothing to integrate)
+        vx, vy = self.velocity.x, self.velocity.y
+        if vx or vy:
+            pos = self.position
+            self.position = Vector2(pos.x + vx * dt, pos.y + vy * dt)
         
         # Update timing
         self.last_update_time += dt
@@ -127,33 +146,52 @@ class BaseEntity:
         Returns:
             True if reached target, False otherwise
         """
-        direction = target - self.position
-        distance = direction.length()
+        dx = target.x - self.position.x
+        dy = target.y - self.position.y
+        distance_sq = dx * dx + dy * dy
+        step = speed * dt
         
-        if distance < speed * dt:
-            # Close enough to target
-            self.position = target
+        if distance_sq < step * step or distance_sq == 0.0:
+            # Close enough to target; rebind rather than mutate, since the
+            # current vectors may be shared with the caller
+            self.position = Vector2(target.x, target.y)
             self.velocity = Vector2(0, 0)
             return True
         
-        # Move toward target
-        direction = direction.normalize()
-        self.velocity = direction * speed
+        # Move toward target: velocity is the unit direction scaled by speed
+        k = speed / sqrt(distance_sq)
+        self.velocity = Vector2(dx * k, dy * k)
         return False
     
     def look_at(self, target: Vector2):
         """Rotate entity to look at target position."""
         self.rotation = self.position.angle_to(target)
     
+    def _update_direction_cache(self):
+        """Recompute cached direction vectors if rotation has changed."""
+        if self._rot_cached != self.rotation:
+            self._rot_cached = self.rotation
+            c, s = cos(self.rotation), sin(self.rotation)
+            self._fwd_cached = Vector2(c, s)
+            self._right_cached = Vector2(-s, c)
+    
     def get_forward_direction(self) -> Vector2:
-        """Get forward direction vector based on rotation."""
-        from math import cos, sin
-        return Vector2(cos(self.rotation), sin(self.rotation))
+        """
+        Get forward direction vector based on rotation.
+        
+        The returned vector is cached until rotation changes; treat it as read-only.
+        """
+        self._update_direction_cache()
+        return self._fwd_cached
     
     def get_right_direction(self) -> Vector2:
-        """Get right direction vector based on rotation."""
-        from math import cos, sin
-        return Vector2(-sin(self.rotation), cos(self.rotation))
+        """
+        Get right direction vector based on rotation.
+        
+        The returned vector is cached until rotation changes; treat it as read-only.
+        """
+        self._update_direction_cache()
+        return self._right_cached
     
     def __repr__(self) -> str:
         """String representation of entity."""
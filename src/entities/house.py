@@ -5,10 +5,31 @@ Represents houses that dispense candy to kids during trick-or-treating.
 Houses can be cursed or blessed to affect the quality of candy they give out.
 """
 
+import logging
+import random
 from typing import List, Dict, Any, Optional
+import pygame
 from ..utils.vector2 import Vector2
 from .base_entity import BaseEntity
 
+_log = logging.getLogger(__name__)
+
+# Per-quality lookup tables (quality level -> value)
+_QUALITY_MULTIPLIERS = {1: 0.5, 2: 1.0, 3: 1.5}
+_QUALITY_ATTRACTION_RADII = {1: 80.0, 2: 100.0, 3: 120.0}
+_QUALITY_COLORS = {
+    1: (150, 150, 150),  # Gray - low quality
+    2: (139, 69, 19),    # Brown - mid quality
+    3: (255, 215, 0),    # Gold - high quality
+}
+
+# House type -> (candy quality, attraction radius)
+_HOUSE_TYPE_STATS = {
+    "mansion": (1.5, 150.0),
+    "spooky": (0.8, 80.0),
+    "normal": (1.0, 100.0),
+}
+
 
 class House(BaseEntity):
     """
@@ -49,8 +70,7 @@ class House(BaseEntity):
     
     def _get_quality_multiplier(self, quality: int) -> float:
         """Get candy quality multiplier based on house quality level."""
-        quality_multipliers = {1: 0.5, 2: 1.0, 3: 1.5}
-        return quality_multipliers.get(quality, 1.0)
+        return _QUALITY_MULTIPLIERS.get(quality, 1.0)
     
     def _get_default_candy_types(self, quality: int) -> List[str]:
         """Get default candy types based on house quality level."""
@@ -63,16 +83,16 @@ class House(BaseEntity):
     
     def _get_attraction_radius(self, quality: int) -> float:
         """Get attraction radius based on house quality level."""
-        attraction_radii = {1: 80.0, 2: 100.0, 3: 120.0}
-        return attraction_radii.get(quality, 100.0)
+        return _QUALITY_ATTRACTION_RADII.get(quality, 100.0)
         
     def update(self, dt: float):
         """Update house state."""
-        super().update(dt)
-        
+        # Houses never move, so skip BaseEntity.update's velocity integration
         if not self.active:
             return
         
+        self.last_update_time += dt
+        
         # Update power effect timers
         self._update_power_effects(dt)
         
@@ -107,7 +127,7 @@ class House(BaseEntity):
         """
         self.curse_timer = duration
         self.quality_multiplier = quality_multiplier
-        print(f"House {self.id} cursed for {duration} seconds")
+        _log.debug("House %s cursed for %s seconds", self.id, duration)
     
     def bless(self, duration: float = 30.0, quality_multiplier: float = 2.5):
         """
@@ -119,19 +139,19 @@ class House(BaseEntity):
         """
         self.bless_timer = duration
         self.quality_multiplier = quality_multiplier
-        print(f"House {self.id} blessed for {duration} seconds")
+        _log.debug("House %s blessed for %s seconds", self.id, duration)
     
     def _remove_curse(self):
         """Remove curse effect."""
         self.curse_timer = 0.0
         self.quality_multiplier = 1.0
-        print(f"House {self.id} curse removed")
+        _log.debug("House %s curse removed", self.id)
     
     def _remove_bless(self):
         """Remove bless effect."""
         self.bless_timer = 0.0
         self.quality_multiplier = 1.0
-        print(f"House {self.id} blessing removed")
+        _log.debug("House %s blessing removed", self.id)
     
     def is_cursed(self) -> bool:
         """Check if house is currently cursed."""
@@ -165,7 +185,6 @@ class House(BaseEntity):
         
         for candy_type in self.candy_types:
             # Base quantity (1-3 pieces)
-            import random
             base_quantity = random.randint(1, 3)
             
             # Apply quality multiplier
@@ -218,15 +237,9 @@ class House(BaseEntity):
         self.house_type = house_type
         
         # Adjust properties based on house type
-        if house_type == "mansion":
-            self.candy_quality = 1.5
-            self.attraction_radius = 150.0
-        elif house_type == "spooky":
-            self.candy_quality = 0.8
-            self.attraction_radius = 80.0
-        elif house_type == "normal":
-            self.candy_quality = 1.0
-            self.attraction_radius = 100.0
+        stats = _HOUSE_TYPE_STATS.get(house_type)
+        if stats:
+            self.candy_quality, self.attraction_radius = stats
     
     def render(self, screen, camera=None):
         """Render the house."""
@@ -235,19 +248,15 @@ class House(BaseEntity):
         if not self.visible or not self.active:
             return
         
-        import pygame
-        
         # Convert world position to screen position
+        # Convert to ints once; reused for the rect and the effect ring
         if camera:
-            screen_pos = camera.world_to_screen(self.position)
+            sx, sy = camera.world_to_screen_xy(self.position.x, self.position.y)
         else:
-            screen_pos = self.position
+            sx, sy = int(self.position.x), int(self.position.y)
         
         # Draw house as a rectangle
-        house_rect = pygame.Rect(
-            screen_pos.x - 20, screen_pos.y - 15,
-            40, 30
-        )
+        house_rect = pygame.Rect(sx - 20, sy - 15, 40, 30)
         
         # Choose color based on house state and quality
         if self.is_blessed():
@@ -255,13 +264,8 @@ class House(BaseEntity):
         elif self.is_cursed():
             color = (255, 100, 100)  # Red for cursed
         else:
-            # Color based on quality level
-            if self.quality == 1:  # Low quality
-                color = (150, 150, 150)  # Gray
-            elif self.quality == 2:  # Mid quality
-                color = (139, 69, 19)  # Brown
-            else:  # High quality
-                color = (255, 215, 0)  # Gold
+            # Color based on quality level (anything above mid renders as high)
+            color = _QUALITY_COLORS.get(self.quality, _QUALITY_COLORS[3])
         
         pygame.draw.rect(screen, color, house_rect)
         pygame.draw.rect(screen, (0, 0, 0), house_rect, 2)
@@ -269,8 +273,7 @@ class House(BaseEntity):
         # Draw power effect indicators
         if self.is_blessed() or self.is_cursed():
             effect_color = (255, 255, 0) if self.is_blessed() else (255, 0, 0)
-            pygame.draw.circle(screen, effect_color, 
-                             screen_pos.to_int_tuple(), 25, 2)
+            pygame.draw.circle(screen, effect_color, (sx, sy), 25, 2)
     
     def get_cooldown_progress(self) -> float:
         """Get cooldown progress as 0.0-1.0 (1.0 = ready, 0.0 = just dispensed)."""
@@ -5,8 +5,12 @@ Represents a trick-or-treating child with AI behavior, trading capabilities,
 and various personality traits that affect their behavior.
 """
 
-from typing import Dict, List, Optional, Any
+import random
+from collections import deque
+from math import sqrt
+from typing import Deque, Dict, List, Optional, Any
 from enum import Enum
+import pygame
 from ..utils.vector2 import Vector2
 from .base_entity import BaseEntity
 
@@ -39,6 +43,60 @@ class Mood(Enum):
     PANIC = 4
 
 
+# BasicBehaviors imports this module, so it is bound lazily on first use
+_basic_behaviors = None
+
+
+def _get_basic_behaviors():
+    """Get the BasicBehaviors class, importing it once."""
+    global _basic_behaviors
+    if _basic_behaviors is None:
+        from ..ai.basic_behaviors import BasicBehaviors
+        _basic_behaviors = BasicBehaviors
+    return _basic_behaviors
+
+
+# Distance at which a kid counts as having arrived at a target or waypoint;
+# movement checks compare squared distances against ARRIVAL_DISTANCE_SQ
+ARRIVAL_DISTANCE = 10.0
+ARRIVAL_DISTANCE_SQ = ARRIVAL_DISTANCE * ARRIVAL_DISTANCE
+
+# Number of trades each kid remembers; older entries fall off the ring buffer
+RECENT_TRADES_LIMIT = 10
+
+# Display color per mood, indexed by Mood.value
+_MOOD_COLORS = (
+    (100, 255, 100),  # HAPPY
+    (255, 255, 255),  # NEUTRAL
+    (255, 255, 100),  # ANXIOUS
+    (255, 100, 255),  # GREEDY
+    (255, 100, 100),  # PANIC
+)
+
+# Pre-drawn kid circles, built lazily per mood the first time they're rendered
+_MOOD_SURFACES: Dict[Mood, pygame.Surface] = {}
+_KID_RADIUS = 10
+
+
+# Trade threshold per personality, indexed by PersonalityType.value
+_PERSONALITY_THRESHOLDS = (
+    1.3,  # VALUE_INVESTOR: stricter, want good deals
+    1.0,  # MOMENTUM_TRADER: average threshold
+    1.5,  # HOARDER: very strict, rarely trade
+    0.7,  # SOCIAL_TRADER: lenient, trade more freely
+    0.5,  # PANIC_SELLER: very lenient, trade anything
+)
+
+# Trade modifier per mood, indexed by Mood.value
+_MOOD_MODIFIERS = (
+    0.9,  # HAPPY: a bit more generous
+    1.0,  # NEUTRAL: normal
+    1.2,  # ANXIOUS: more cautious, need better deals
+    1.3,  # GREEDY: very strict, only good deals
+    0.5,  # PANIC: panic selling, accept bad deals
+)
+
+
 class Kid(BaseEntity):
     """
     Represents a trick-or-treating child with AI behavior.
@@ -47,6 +105,16 @@ class Kid(BaseEntity):
     their trading behavior and movement patterns.
     """
     
+    __slots__ = (
+        'state', 'personality', 'mood', 'color',
+        'preferences', 'believed_values', 'inventory', 'debts',
+        'social_network', 'trust_levels', 'last_trade_partner', 'trading_bloc',
+        'personal_goal', 'recent_trades', 'observed_strategies',
+        'trade_cooldown', 'trick_or_treat_timer',
+        'target_position', 'target_house', 'max_speed', 'collision_radius',
+        'current_path', 'path_index', 'use_pathfinding',
+    )
+    
     def __init__(self, kid_id: str, position: Vector2 = None):
         """
         Initialize a kid entity.
@@ -71,19 +139,19 @@ class Kid(BaseEntity):
         # Social attributes
         self.social_network: List[str] = []  # List of kid IDs
         self.trust_levels: Dict[str, float] = {}  # Kid ID -> trust level (0-1)
+        self.last_trade_partner: Optional['Kid'] = None  # Tried first on the next trade
         self.trading_bloc = None  # TradingBloc reference
         
         # Personal goal
         self.personal_goal = None  # PersonalGoal reference
         
         # Memory and learning
-        self.recent_trades: List[Dict[str, Any]] = []
+        self.recent_trades: Deque[Dict[str, Any]] = deque(maxlen=RECENT_TRADES_LIMIT)
         self.observed_strategies: Dict[str, float] = {}  # Strategy -> success rate
         
         # Timers
         self.trade_cooldown = 0.0
         self.trick_or_treat_timer = 0.0
-        self.ai_tick_timer = 0.0
         
         # Movement
         self.target_position: Optional[Vector2] = None
@@ -104,24 +172,20 @@ class Kid(BaseEntity):
             economy: Economy system with real values
             mode: "fixed", "random", or "convergent"
         """
-        import random
-        
         if mode == "fixed":
             # Kids know the true values
             self.believed_values = economy.real_values.copy()
         elif mode == "random":
             # Kids have random beliefs (0.5 to 5.0 range)
-            self.believed_values = {}
-            for candy_type in economy.real_values.keys():
-                self.believed_values[candy_type] = random.uniform(0.5, 5.0)
+            uniform = random.uniform
+            self.believed_values = {candy_type: uniform(0.5, 5.0)
+                                    for candy_type in economy.real_values}
         elif mode == "convergent":
-            # Start random but will converge through trading
-            self.believed_values = {}
-            for candy_type in economy.real_values.keys():
-                # Start with some variation around real value
-                real_value = economy.real_values[candy_type]
-                variation = random.uniform(0.5, 1.5)  # 50% to 150% of real value
-                self.believed_values[candy_type] = real_value * variation
+            # Start random but will converge through trading, with some
+            # variation around the real value (50% to 150%)
+            uniform = random.uniform
+            self.believed_values = {candy_type: real_value * uniform(0.5, 1.5)
+                                    for candy_type, real_value in economy.real_values.items()}
         else:
             # Default to fixed
             self.believed_values = economy.real_values.copy()
@@ -139,20 +203,37 @@ class Kid(BaseEntity):
         """
         # Calculate the implied price from the trade
         # If we offered 1 CHOCOLATE for 1 FRUITY, implied price of FRUITY = CHOCOLATE_value
+        beliefs = self.believed_values
+        requested = [(candy, qty) for candy, qty in trade_request.items() if qty > 0]
+        if not requested:
+            return
+        
         for offered_candy, offered_qty in trade_offer.items():
-            for requested_candy, requested_qty in trade_request.items():
-                if offered_qty > 0 and requested_qty > 0:
-                    # Implied price: 1 requested_candy = (offered_value / requested_qty)
-                    offered_value = self.believed_values.get(offered_candy, economy.get_real_value(offered_candy))
-                    implied_price = (offered_value * offered_qty) / requested_qty
-                    
-                    # Update belief toward implied price
-                    current_belief = self.believed_values.get(requested_candy, economy.get_real_value(requested_candy))
-                    new_belief = current_belief + learning_rate * (implied_price - current_belief)
-                    
-                    # Keep within reasonable bounds
-                    new_belief = max(0.1, min(10.0, new_belief))
-                    self.believed_values[requested_candy] = new_belief
+            if offered_qty <= 0:
+                continue
+            
+            # Value of what we gave, looked up once per offered candy
+            offered_value = beliefs.get(offered_candy)
+            if offered_value is None:
+                offered_value = economy.get_real_value(offered_candy)
+            offered_total = offered_value * offered_qty
+            
+            for requested_candy, requested_qty in requested:
+                # Implied price: 1 requested_candy = (offered_value / requested_qty)
+                implied_price = offered_total / requested_qty
+                
+                # Update belief toward implied price
+                current_belief = beliefs.get(requested_candy)
+                if current_belief is None:
+                    current_belief = economy.get_real_value(requested_candy)
+                new_belief = current_belief + learning_rate * (implied_price - current_belief)
+                
+                # Keep within reasonable bounds
+                if new_belief < 0.1:
+                    new_belief = 0.1
+                elif new_belief > 10.0:
+                    new_belief = 10.0
+                beliefs[requested_candy] = new_belief
         
     def update(self, dt: float, renderer=None):
         """Update kid state and behavior."""
@@ -161,31 +242,49 @@ class Kid(BaseEntity):
         if not self.active:
             return
         
-        # Update timers
-        self.trade_cooldown = max(0, self.trade_cooldown - dt)
-        self.trick_or_treat_timer = max(0, self.trick_or_treat_timer - dt)
-        self.ai_tick_timer += dt
+        # Fast path: an idle kid with no running timers has nothing to do
+        # until its next AI tick
+        if (self.state is KidState.IDLE and not self.trade_cooldown
+                and not self.trick_or_treat_timer):
+            return
+        
+        # Update timers, touching only the ones still running (both sit at
+        # zero most of the time)
+        if self.trade_cooldown > 0:
+            self.trade_cooldown = self.trade_cooldown - dt if self.trade_cooldown > dt else 0.0
+        if self.trick_or_treat_timer > 0:
+            self.trick_or_treat_timer = self.trick_or_treat_timer - dt if self.trick_or_treat_timer > dt else 0.0
         
         # State-based behavior
         self._update_state_behavior(dt, renderer)
     
+    def _update_moving_to_house(self, dt: float, renderer=None):
+        """Walk toward the target house and start trick-or-treating on arrival."""
+        if self.target_position:
+            if self._move_with_pathfinding(self.target_position, self.max_speed, dt):
+                self.state = KidState.TRICK_OR_TREATING
+                self.trick_or_treat_timer = 2.0  # Spend 2 seconds trick-or-treating
+    
+    def _update_trick_or_treating(self, dt: float, renderer=None):
+        """Collect candy from the target house once the visit timer runs out."""
+        if self.trick_or_treat_timer <= 0:
+            # Try to get candy from the house
+            if self.target_house:
+                _get_basic_behaviors().execute_trick_or_treat(self, self.target_house, renderer)
+            self.state = KidState.IDLE
+    
+    # Per-frame behavior for each state; states without an entry (SEEKING_TRADE
+    # movement, for instance) are handled in the AI tick
+    _STATE_HANDLERS = {
+        KidState.MOVING_TO_HOUSE: _update_moving_to_house,
+        KidState.TRICK_OR_TREATING: _update_trick_or_treating,
+    }
+    
     def _update_state_behavior(self, dt: float, renderer=None):
         """Update behavior based on current state."""
-        if self.state == KidState.MOVING_TO_HOUSE:
-            if self.target_position:
-                if self._move_with_pathfinding(self.target_position, self.max_speed, dt):
-                    self.state = KidState.TRICK_OR_TREATING
-                    self.trick_or_treat_timer = 2.0  # Spend 2 seconds trick-or-treating
-        elif self.state == KidState.TRICK_OR_TREATING:
-            if self.trick_or_treat_timer <= 0:
-                # Try to get candy from the house
-                if self.target_house:
-                    from ..ai.basic_behaviors import BasicBehaviors
-                    BasicBehaviors.execute_trick_or_treat(self, self.target_house, renderer)
-                self.state = KidState.IDLE
-        elif self.state == KidState.SEEKING_TRADE:
-            # Movement handled in AI tick
-            pass
+        handler = self._STATE_HANDLERS.get(self.state)
+        if handler is not None:
+            handler(self, dt, renderer)
     
     def ai_tick(self, world):
         """
@@ -198,8 +297,7 @@ class Kid(BaseEntity):
             return
         
         # Use basic behaviors for now
-        from ..ai.basic_behaviors import BasicBehaviors
-        BasicBehaviors.update_kid_behavior(self, world, 0.0)
+        _get_basic_behaviors().update_kid_behavior(self, world, 0.0)
         
         # Check debt obligations first
         if self._has_overdue_debt():
@@ -234,9 +332,8 @@ class Kid(BaseEntity):
             self.state = KidState.IDLE
             return
         
-        # Pick a random house
-        import random
-        target_house = random.choice(world.houses)
+        # Pick a random house using the world's shared RNG
+        target_house = world.rng.choice(world.houses)
         self.target_house = target_house
         self.target_position = target_house.position
         self.state = KidState.MOVING_TO_HOUSE
@@ -284,11 +381,11 @@ class Kid(BaseEntity):
     def _calculate_value(self, candy_dict: Dict[str, int], economy) -> float:
         """Calculate value of candy using believed values."""
         total_value = 0.0
+        believed = self.believed_values.get
         for candy_type, quantity in candy_dict.items():
             # Use believed value if available, otherwise real value
-            if candy_type in self.believed_values:
-                value = self.believed_values[candy_type]
-            else:
+            value = believed(candy_type)
+            if value is None:
                 value = economy.get_real_value(candy_type)
             
             total_value += value * quantity
@@ -297,41 +394,27 @@ class Kid(BaseEntity):
     
     def _get_personality_threshold(self) -> float:
         """Get trade threshold based on personality."""
-        thresholds = {
-            PersonalityType.VALUE_INVESTOR: 1.3,      # Stricter, want good deals
-            PersonalityType.MOMENTUM_TRADER: 1.0,     # Average threshold
-            PersonalityType.HOARDER: 1.5,             # Very strict, rarely trade
-            PersonalityType.SOCIAL_TRADER: 0.7,       # Lenient, trade more freely
-            PersonalityType.PANIC_SELLER: 0.5,        # Very lenient, trade anything
-        }
-        return thresholds.get(self.personality, 1.0)
+        return _PERSONALITY_THRESHOLDS[self.personality.value]
     
     def _get_mood_modifier(self) -> float:
         """Get trade modifier based on mood."""
-        modifiers = {
-            Mood.HAPPY: 0.9,      # A bit more generous
-            Mood.NEUTRAL: 1.0,    # Normal
-            Mood.ANXIOUS: 1.2,    # More cautious, need better deals
-            Mood.GREEDY: 1.3,     # Very strict, only good deals
-            Mood.PANIC: 0.5,      # Panic selling, accept bad deals
-        }
-        return modifiers.get(self.mood, 1.0)
+        return _MOOD_MODIFIERS[self.mood.value]
     
     def _get_preference_modifier(self, request: Dict[str, int], offer: Dict[str, int]) -> float:
         """Calculate preference-based modifier for the trade."""
+        preference = self.preferences.get
+        
         # Bonus for receiving candy we like
         request_bonus = 0.0
         for candy_type, quantity in request.items():
-            preference = self.preferences.get(candy_type, 0.5)
-            request_bonus += preference * quantity * 0.5
+            request_bonus += preference(candy_type, 0.5) * quantity
         
         # Penalty for giving away candy we like
         offer_penalty = 0.0
         for candy_type, quantity in offer.items():
-            preference = self.preferences.get(candy_type, 0.5)
-            offer_penalty += preference * quantity * 0.3
+            offer_penalty += preference(candy_type, 0.5) * quantity
         
-        return request_bonus - offer_penalty
+        return request_bonus * 0.5 - offer_penalty * 0.3
     
     def hear_rumor(self, rumor):
         """Process a rumor and update beliefs."""
@@ -345,9 +428,8 @@ class Kid(BaseEntity):
     
     def add_candy(self, candy_type: str, quantity: int):
         """Add candy to inventory."""
-        if candy_type not in self.inventory:
-            self.inventory[candy_type] = 0
-        self.inventory[candy_type] += quantity
+        inventory = self.inventory
+        inventory[candy_type] = inventory.get(candy_type, 0) + quantity
     
     def remove_candy(self, candy_type: str, quantity: int) -> bool:
         """
@@ -356,9 +438,11 @@ class Kid(BaseEntity):
         Returns:
             True if successful, False if not enough candy
         """
-        if candy_type not in self.inventory or self.inventory[candy_type] < quantity:
+        inventory = self.inventory
+        held = inventory.get(candy_type)
+        if held is None or held < quantity:
             return False
-        self.inventory[candy_type] -= quantity
+        inventory[candy_type] = held - quantity
         return True
     
     def has_candy(self, candy_type: str, quantity: int = 1) -> bool:
@@ -367,11 +451,10 @@ class Kid(BaseEntity):
     
     def get_total_candy_value(self, real_values: Dict[str, float]) -> float:
         """Calculate total value of kid's candy inventory."""
-        total = 0.0
-        for candy_type, quantity in self.inventory.items():
-            if candy_type in real_values:
-                total += real_values[candy_type] * quantity
-        return total
+        # One hash per entry; unknown candy types contribute nothing
+        value_of = real_values.get
+        return sum([value_of(candy_type, 0.0) * quantity
+                    for candy_type, quantity in self.inventory.items()], 0.0)
     
     def render(self, screen, camera=None):
         """Render the kid."""
@@ -382,17 +465,21 @@ class Kid(BaseEntity):
         
         # Placeholder rendering - will be implemented in later sprints
         # For now, just render a colored circle
-        import pygame
-        
         # Convert world position to screen position
         if camera:
-            screen_pos = camera.world_to_screen(self.position)
+            sx, sy = camera.world_to_screen_xy(self.position.x, self.position.y)
         else:
-            screen_pos = self.position
-        
-        # Draw kid as a colored circle
-        color = self._get_mood_color()
-        pygame.draw.circle(screen, color, screen_pos.to_int_tuple(), 10)
+            sx, sy = int(self.position.x), int(self.position.y)
+        
+        # Draw kid as a colored circle, blitted from a per-mood cached surface
+        surface = _MOOD_SURFACES.get(self.mood)
+        if surface is None:
+            size = _KID_RADIUS * 2 + 2
+            surface = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(surface, self._get_mood_color(), (size // 2, size // 2), _KID_RADIUS)
+            _MOOD_SURFACES[self.mood] = surface
+        offset = _KID_RADIUS + 1
+        screen.blit(surface, (sx - offset, sy - offset))
     
     def move_toward(self, target: Vector2, speed: float, dt: float) -> bool:
         """
@@ -409,27 +496,29 @@ class Kid(BaseEntity):
         if not target:
             return True
         
-        # Calculate direction to target
-        direction = target - self.position
-        distance = direction.length()
+        # Calculate direction to target on plain floats (no Vector2 temporaries)
+        pos = self.position
+        dx = target.x - pos.x
+        dy = target.y - pos.y
+        distance_sq = dx * dx + dy * dy
         
         # Check if we've reached the target
-        arrival_distance = 10.0  # Close enough to consider "arrived"
-        if distance <= arrival_distance:
+        if distance_sq <= ARRIVAL_DISTANCE_SQ:
             return True
         
         # Move toward target
-        if distance > 0:
-            # Normalize direction and apply speed
-            move_distance = speed * dt
-            if move_distance >= distance:
-                # Would overshoot, just go to target
-                self.position = target
-                return True
-            else:
-                # Move partway toward target
-                self.position += direction.normalize() * move_distance
+        distance = sqrt(distance_sq)
+        move_distance = speed * dt
+        if move_distance >= distance:
+            # Would overshoot, just go to target (copied so we never share the
+            # target's vector, which usually belongs to a house)
+            self.position = Vector2(target.x, target.y)
+            return True
         
+        # Move partway toward target. Rebind rather than mutate in place, since
+        # a kid's position vector may be shared with other objects.
+        k = move_distance / distance
+        self.position = Vector2(pos.x + dx * k, pos.y + dy * k)
         return False
     
     def _move_with_pathfinding(self, target: Vector2, speed: float, dt: float) -> bool:
@@ -457,7 +546,10 @@ class Kid(BaseEntity):
         current_waypoint = self.current_path[self.path_index]
         
         # Check if we've reached the current waypoint
-        if self.position.distance_to(current_waypoint) <= 10.0:
+        pos = self.position
+        dx = current_waypoint.x - pos.x
+        dy = current_waypoint.y - pos.y
+        if dx * dx + dy * dy <= ARRIVAL_DISTANCE_SQ:
             self.path_index += 1
             
             # If we've reached the end of the path, we're at the target
@@ -468,13 +560,19 @@ class Kid(BaseEntity):
         return self.move_toward(current_waypoint, speed, dt)
     
     def set_path(self, path: List[Vector2]):
-        """Set a new path for the kid to follow."""
-        self.current_path = path
+        """
+        Set a new path for the kid to follow.
+        
+        The waypoints are copied into the kid's own list, which is reused
+        across repaths; pathfinding may hand out the same cached path to
+        several kids, so it must never be held directly.
+        """
+        self.current_path[:] = path
         self.path_index = 0
     
     def clear_path(self):
         """Clear the current path."""
-        self.current_path = []
+        self.current_path.clear()
         self.path_index = 0
     
     def reached_target(self) -> bool:
@@ -482,19 +580,14 @@ class Kid(BaseEntity):
         if not self.target_position:
             return True
         
-        distance = self.position.distance_to(self.target_position)
-        return distance <= 10.0  # Arrival distance
+        target = self.target_position
+        dx = target.x - self.position.x
+        dy = target.y - self.position.y
+        return dx * dx + dy * dy <= ARRIVAL_DISTANCE_SQ
     
     def _get_mood_color(self) -> tuple:
         """Get color based on current mood."""
-        mood_colors = {
-            Mood.HAPPY: (100, 255, 100),
-            Mood.NEUTRAL: (255, 255, 255),
-            Mood.ANXIOUS: (255, 255, 100),
-            Mood.GREEDY: (255, 100, 255),
-            Mood.PANIC: (255, 100, 100)
-        }
-        return mood_colors.get(self.mood, (255, 255, 255))
+        return _MOOD_COLORS[self.mood.value]
     
     def check_collision_with_kids(self, other_kids: List['Kid']) -> List['Kid']:
         """
@@ -507,15 +600,20 @@ class Kid(BaseEntity):
             List of kids this kid is colliding with
         """
         colliding_kids = []
+        x, y = self.position.x, self.position.y
+        radius = self.collision_radius
         
         for other_kid in other_kids:
-            if other_kid == self or not other_kid.active:
+            if other_kid is self or not other_kid.active:
                 continue
             
-            distance = self.position.distance_to(other_kid.position)
-            min_distance = self.collision_radius + other_kid.collision_radius
+            # Compare squared distances to skip the sqrt and Vector2 temporaries
+            other_pos = other_kid.position
+            dx = other_pos.x - x
+            dy = other_pos.y - y
+            min_distance = radius + other_kid.collision_radius
             
-            if distance < min_distance:
+            if dx * dx + dy * dy < min_distance * min_distance:
                 colliding_kids.append(other_kid)
         
         return colliding_kids
@@ -531,22 +629,24 @@ class Kid(BaseEntity):
         if not colliding_kids:
             return
         
-        separation_force = Vector2(0, 0)
+        x, y = self.position.x, self.position.y
+        separation_strength = 100.0  # Force strength
+        fx = fy = 0.0
         
         for other_kid in colliding_kids:
-            # Calculate direction away from other kid
-            direction = self.position - other_kid.position
-            distance = direction.length()
+            # Direction away from the other kid, normalized and scaled
+            dx = x - other_kid.position.x
+            dy = y - other_kid.position.y
+            distance_sq = dx * dx + dy * dy
             
-            if distance > 0:
-                # Normalize and scale by separation strength
-                direction = direction.normalized()
-                separation_strength = 100.0  # Force strength
-                force = direction * separation_strength
-                separation_force += force
+            if distance_sq > 0:
+                k = separation_strength / sqrt(distance_sq)
+                fx += dx * k
+                fy += dy * k
         
         # Apply separation force to movement
-        if separation_force.length() > 0:
+        force_sq = fx * fx + fy * fy
+        if force_sq > 0:
             # Normalize and apply as movement offset
-            separation_force = separation_force.normalized()
-            self.position += separation_force * self.max_speed * dt * 0.5
+            k = self.max_speed * dt * 0.5 / sqrt(force_sq)
+            self.position = Vector2(x + fx * k, y + fy * k)
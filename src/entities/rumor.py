@@ -5,7 +5,9 @@ Represents rumors that can be spread among kids to influence their beliefs
 and trading behavior.
 """
 
-from typing import Dict, List, Any, Optional
+import random
+import sys
+from typing import Dict, Set, Any, Optional
 from enum import Enum
 from ..utils.vector2 import Vector2
 
@@ -19,6 +21,16 @@ class RumorType(Enum):
     EVENT = 4  # "There's a candy recall coming!"
 
 
+# Ways a rumor's wording drifts when it mutates; {0} is the lowercased
+# content and {1} the content as-is
+_MUTATION_TEMPLATES = (
+    "I heard that {0}",
+    "Someone told me {0}",
+    "I think {0}",
+    "{1} (I'm not sure though)",
+)
+
+
 class Rumor:
     """
     Represents a rumor that can spread through the kid social network.
@@ -27,6 +39,14 @@ class Rumor:
     market information, creating opportunities for manipulation.
     """
     
+    __slots__ = (
+        'id', 'type', 'content', 'origin_kid_id',
+        '_believability', 'age', 'max_age', 'spread_radius', 'max_depth',
+        'spread_count', 'affected_kids', 'mutations',
+        '_effect_strength', 'target_candy_type', '_value_modifier',
+        '_price_effect', '_quality_effect',
+    )
+    
     def __init__(self, rumor_id: str, rumor_type: RumorType, content: str, 
                  origin_kid_id: str, believability: float = 0.5):
         """
@@ -39,10 +59,10 @@ class Rumor:
             origin_kid_id: ID of kid who started the rumor
             believability: How believable the rumor is (0.0 to 1.0)
         """
-        self.id = rumor_id
+        self.id = sys.intern(rumor_id)
         self.type = rumor_type
         self.content = content
-        self.origin_kid_id = origin_kid_id
+        self.origin_kid_id = sys.intern(origin_kid_id)
         
         # Rumor properties
         self.believability = believability
@@ -53,13 +73,51 @@ class Rumor:
         
         # Spread tracking
         self.spread_count = 0
-        self.affected_kids: List[str] = []  # Kids who have heard this rumor
+        self.affected_kids: Set[str] = set()  # Kids who have heard this rumor
         self.mutations = 0  # Number of times rumor has mutated
         
         # Effect properties
         self.effect_strength = 1.0  # How strong the rumor's effect is
         self.target_candy_type: Optional[str] = None
         self.value_modifier = 1.0  # Multiplier for candy values
+    
+    # Effect inputs are properties so the derived multipliers below can be
+    # cached and only recomputed after a mutation, decay or explicit change
+    
+    @property
+    def believability(self) -> float:
+        """How believable the rumor is (0.0 to 1.0)."""
+        return self._believability
+    
+    @believability.setter
+    def believability(self, value: float):
+        self._believability = value
+        self._invalidate_effects()
+    
+    @property
+    def effect_strength(self) -> float:
+        """How strong the rumor's effect is."""
+        return self._effect_strength
+    
+    @effect_strength.setter
+    def effect_strength(self, value: float):
+        self._effect_strength = value
+        self._invalidate_effects()
+    
+    @property
+    def value_modifier(self) -> float:
+        """Multiplier for candy values."""
+        return self._value_modifier
+    
+    @value_modifier.setter
+    def value_modifier(self, value: float):
+        self._value_modifier = value
+        self._invalidate_effects()
+    
+    def _invalidate_effects(self):
+        """Drop cached effect multipliers so they are recomputed on next use."""
+        self._price_effect: Optional[float] = None
+        self._quality_effect: Optional[float] = None
         
     def update(self, dt: float):
         """
@@ -118,11 +176,10 @@ class Rumor:
         if not self.can_spread_to(kid_id):
             return
         
-        self.affected_kids.append(kid_id)
+        self.affected_kids.add(kid_id)
         self.spread_count += 1
         
         # Chance for mutation
-        import random
         if random.random() < mutation_chance:
             self._mutate()
     
@@ -131,7 +188,6 @@ class Rumor:
         self.mutations += 1
         
         # Slightly change believability
-        import random
         change = random.uniform(-0.1, 0.1)
         self.believability = max(0.0, min(1.0, self.believability + change))
         
@@ -146,15 +202,8 @@ class Rumor:
     def _mutate_content(self):
         """Mutate the rumor content."""
         # Simple content mutation - in a real game, this could be more sophisticated
-        mutations = [
-            "I heard that " + self.content.lower(),
-            "Someone told me " + self.content.lower(),
-            "I think " + self.content.lower(),
-            self.content + " (I'm not sure though)",
-        ]
-        
-        import random
-        self.content = random.choice(mutations)
+        content = self.content
+        self.content = random.choice(_MUTATION_TEMPLATES).format(content.lower(), content)
     
     def get_effect_on_candy_value(self, candy_type: str) -> float:
         """
@@ -172,9 +221,13 @@ class Rumor:
         if self.target_candy_type and candy_type != self.target_candy_type:
             return 1.0
         
-        # Apply rumor effect
-        effect = self.value_modifier * self.effect_strength * self.believability
-        return max(0.1, min(5.0, effect))  # Clamp to reasonable range
+        # Apply rumor effect (cached until the inputs change)
+        effect = self._price_effect
+        if effect is None:
+            effect = self._value_modifier * self._effect_strength * self._believability
+            effect = max(0.1, min(5.0, effect))  # Clamp to reasonable range
+            self._price_effect = effect
+        return effect
     
     def get_effect_on_quality(self, candy_type: str) -> float:
         """
@@ -192,9 +245,13 @@ class Rumor:
         if self.target_candy_type and candy_type != self.target_candy_type:
             return 1.0
         
-        # Apply rumor effect
-        effect = self.effect_strength * self.believability
-        return max(0.1, min(2.0, effect))  # Clamp to reasonable range
+        # Apply rumor effect (cached until the inputs change)
+        effect = self._quality_effect
+        if effect is None:
+            effect = self._effect_strength * self._believability
+            effect = max(0.1, min(2.0, effect))  # Clamp to reasonable range
+            self._quality_effect = effect
+        return effect
     
     def get_trust_effect(self, kid_id: str) -> float:
         """
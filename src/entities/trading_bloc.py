@@ -5,7 +5,8 @@ Represents groups of kids who form trading alliances, sharing information
 and trading preferentially with each other.
 """
 
-from typing import List, Dict, Any, Optional
+import heapq
+from typing import List, Dict, Any, Optional, Set
 from ..utils.vector2 import Vector2
 
 
@@ -17,6 +18,12 @@ class TradingBloc:
     information advantages and better trading rates to members.
     """
     
+    __slots__ = (
+        'id', '_members', '_member_order', 'shared_beliefs', '_member_strength',
+        'formation_time', 'color',
+        'internal_trades', 'external_trades', 'total_profit', '_activity',
+    )
+    
     def __init__(self, bloc_id: str):
         """
         Initialize a trading bloc.
@@ -25,9 +32,10 @@ class TradingBloc:
             bloc_id: Unique identifier for this bloc
         """
         self.id = bloc_id
-        self.members: List[str] = []  # List of kid IDs
+        self._members: Set[str] = set()  # Kid IDs, for O(1) membership tests
+        self._member_order: List[str] = []  # Kid IDs in join order
         self.shared_beliefs: Dict[str, float] = {}  # Candy type -> believed value
-        self.bloc_strength = 0.0  # Strength of the bloc (0.0 to 1.0)
+        self._member_strength = 0.0  # Strength from member count alone
         self.formation_time = 0.0  # When the bloc was formed
         self.color = (100, 100, 255)  # Visual color for bloc members
         
@@ -35,6 +43,7 @@ class TradingBloc:
         self.internal_trades = 0  # Trades between bloc members
         self.external_trades = 0  # Trades with non-members
         self.total_profit = 0.0  # Total profit from bloc trades
+        self._activity: Dict[str, int] = {}  # Kid ID -> trades recorded since last fracture
         
     def add_member(self, kid_id: str):
         """
@@ -43,8 +52,9 @@ class TradingBloc:
         Args:
             kid_id: ID of the kid to add
         """
-        if kid_id not in self.members:
-            self.members.append(kid_id)
+        if kid_id not in self._members:
+            self._members.add(kid_id)
+            self._member_order.append(kid_id)
             self._update_strength()
     
     def remove_member(self, kid_id: str):
@@ -54,8 +64,10 @@ class TradingBloc:
         Args:
             kid_id: ID of the kid to remove
         """
-        if kid_id in self.members:
-            self.members.remove(kid_id)
+        if kid_id in self._members:
+            self._members.discard(kid_id)
+            self._member_order.remove(kid_id)  # Rare path, order must be kept
+            self._activity.pop(kid_id, None)
             self._update_strength()
     
     def is_member(self, kid_id: str) -> bool:
@@ -68,30 +80,47 @@ class TradingBloc:
         Returns:
             True if kid is a member
         """
-        return kid_id in self.members
+        return kid_id in self._members
+    
+    @property
+    def members(self) -> List[str]:
+        """Member kid IDs in join order (treat as read-only)."""
+        return self._member_order
+    
+    @members.setter
+    def members(self, kid_ids: List[str]):
+        """Replace the whole membership, keeping the given order."""
+        self._members = set()
+        self._member_order = []
+        for kid_id in kid_ids:
+            if kid_id not in self._members:
+                self._members.add(kid_id)
+                self._member_order.append(kid_id)
+        self._update_strength()
     
     def get_member_count(self) -> int:
         """Get the number of members in this bloc."""
-        return len(self.members)
+        return len(self._members)
     
     def can_form(self) -> bool:
         """Check if this bloc can be formed (needs 3+ members)."""
-        return len(self.members) >= 3
+        return len(self._members) >= 3
     
     def _update_strength(self):
-        """Update bloc strength based on member count and trading activity."""
-        # Base strength from member count
-        member_strength = min(1.0, len(self.members) / 10.0)
-        
-        # Trading activity bonus
+        """Update the member-count part of bloc strength after a membership change."""
+        self._member_strength = min(1.0, len(self._members) / 10.0)
+    
+    def _trading_activity_bonus(self) -> float:
+        """Strength bonus from the share of trades kept inside the bloc."""
         total_trades = self.internal_trades + self.external_trades
         if total_trades > 0:
-            internal_ratio = self.internal_trades / total_trades
-            trading_bonus = internal_ratio * 0.3  # Up to 30% bonus
-        else:
-            trading_bonus = 0.0
-        
-        self.bloc_strength = min(1.0, member_strength + trading_bonus)
+            return (self.internal_trades / total_trades) * 0.3  # Up to 30% bonus
+        return 0.0
+    
+    @property
+    def bloc_strength(self) -> float:
+        """Strength of the bloc (0.0 to 1.0) from member count and trading activity."""
+        return min(1.0, self._member_strength + self._trading_activity_bonus())
     
     def update_shared_beliefs(self, new_beliefs: Dict[str, float], kid_id: str):
         """
@@ -105,14 +134,15 @@ class TradingBloc:
             return
         
         # Update shared beliefs (weighted average with existing beliefs)
+        shared = self.shared_beliefs
+        existing_of = shared.get
         for candy_type, value in new_beliefs.items():
-            if candy_type in self.shared_beliefs:
-                # Weighted average: 70% existing, 30% new
-                self.shared_beliefs[candy_type] = (
-                    self.shared_beliefs[candy_type] * 0.7 + value * 0.3
-                )
+            existing = existing_of(candy_type)
+            if existing is None:
+                shared[candy_type] = value
             else:
-                self.shared_beliefs[candy_type] = value
+                # Weighted average: 70% existing, 30% new
+                shared[candy_type] = existing * 0.7 + value * 0.3
     
     def get_shared_belief(self, candy_type: str) -> Optional[float]:
         """
@@ -135,13 +165,20 @@ class TradingBloc:
             kid_b_id: ID of second kid
             profit: Profit from the trade
         """
-        if self.is_member(kid_a_id) and self.is_member(kid_b_id):
+        a_is_member = kid_a_id in self._members
+        b_is_member = kid_b_id in self._members
+        if a_is_member and b_is_member:
             self.internal_trades += 1
             self.total_profit += profit
         else:
             self.external_trades += 1
         
-        self._update_strength()
+        # Per-member activity decides who stays if the bloc fractures
+        activity = self._activity
+        if a_is_member:
+            activity[kid_a_id] = activity.get(kid_a_id, 0) + 1
+        if b_is_member:
+            activity[kid_b_id] = activity.get(kid_b_id, 0) + 1
     
     def get_trading_bonus(self) -> float:
         """
@@ -171,7 +208,7 @@ class TradingBloc:
             True if bloc should fracture
         """
         # Fracture if too few members
-        if len(self.members) < 2:
+        if len(self._members) < 2:
             return True
         
         # Fracture if too many external trades (members trading outside bloc)
@@ -190,15 +227,17 @@ class TradingBloc:
         Returns:
             List of kid IDs who remain in the bloc
         """
-        # Keep the most active members (simplified logic)
-        keep_count = max(1, len(self.members) // 2)
-        remaining_members = self.members[:keep_count]
+        # Keep the most active members; ties go to whoever joined first
+        keep_count = max(1, len(self._member_order) // 2)
+        activity = self._activity
+        remaining_members = heapq.nlargest(keep_count, self._member_order,
+                                           key=lambda kid_id: activity.get(kid_id, 0))
         
         # Reset statistics
         self.internal_trades = 0
         self.external_trades = 0
         self.total_profit = 0.0
-        self._update_strength()
+        self._activity = {}
         
         return remaining_members
     
@@ -206,7 +245,7 @@ class TradingBloc:
         """Get statistics about the trading bloc."""
         return {
             'id': self.id,
-            'member_count': len(self.members),
+            'member_count': len(self._members),
             'strength': self.bloc_strength,
             'internal_trades': self.internal_trades,
             'external_trades': self.external_trades,
@@ -216,4 +255,4 @@ class TradingBloc:
     
     def __repr__(self) -> str:
         """String representation of trading bloc."""
-        return f"TradingBloc(id={self.id}, members={len(self.members)}, strength={self.bloc_strength:.2f})"
+        return f"TradingBloc(id={self.id}, members={len(self._members)}, strength={self.bloc_strength:.2f})"
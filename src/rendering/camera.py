@@ -5,7 +5,8 @@ Handles camera positioning, zoom, and coordinate transformations
 for rendering the game world.
 """
 
-from typing import Tuple
+from math import exp
+from typing import Iterable, List, Tuple
 from ..utils.vector2 import Vector2
 from ..core.constants import SCREEN_SIZE
 
@@ -34,9 +35,14 @@ class Camera:
         # Camera bounds
         self.bounds = None  # (min_x, min_y, max_x, max_y)
         
-        # Smooth movement
-        self.move_speed = 5.0
-        self.zoom_speed = 2.0
+        # Screen center in pixels, the origin of every transform
+        self._center_x = SCREEN_SIZE[0] // 2
+        self._center_y = SCREEN_SIZE[1] // 2
+        
+        # Smooth movement: exponential decay rates (per second) of the
+        # remaining distance to the target position and zoom
+        self.move_decay = 5.0
+        self.zoom_decay = 2.0
         
     def update(self, dt: float):
         """
@@ -45,32 +51,40 @@ class Camera:
         Args:
             dt: Delta time in seconds
         """
-        # Smooth movement to target
-        if self.position != self.target_position:
-            direction = self.target_position - self.position
-            distance = direction.length()
-            
-            if distance > 1.0:  # Don't jitter
-                move_distance = self.move_speed * dt
-                if move_distance >= distance:
-                    self.position = self.target_position
-                else:
-                    self.position += direction.normalize() * move_distance
+        # Smooth movement to target: the remaining offset shrinks by
+        # exp(-decay * dt), which behaves the same at any frame rate.
+        # Positions are rebound, never mutated, since they may be shared
+        # with the target or with whoever passed them in.
+        target = self.target_position
+        position = self.position
+        dx = position.x - target.x
+        dy = position.y - target.y
+        if dx or dy:
+            k = exp(-self.move_decay * dt)
+            dx *= k
+            dy *= k
+            if dx * dx + dy * dy < 0.01:  # Within 0.1 units: snap to avoid jitter
+                self.position = Vector2(target.x, target.y)
+            else:
+                self.position = Vector2(target.x + dx, target.y + dy)
         
         # Smooth zoom to target
-        if abs(self.zoom - self.target_zoom) > 0.01:
-            zoom_diff = self.target_zoom - self.zoom
-            zoom_change = self.zoom_speed * dt
-            
-            if abs(zoom_diff) <= zoom_change:
+        zoom_diff = self.zoom - self.target_zoom
+        if abs(zoom_diff) > 0.01:
+            zoom_diff *= exp(-self.zoom_decay * dt)
+            if abs(zoom_diff) <= 0.01:
                 self.zoom = self.target_zoom
             else:
-                self.zoom += zoom_diff * zoom_change
+                self.zoom = self.target_zoom + zoom_diff
         
         # Apply bounds
         if self.bounds:
-            self.position.x = max(self.bounds[0], min(self.bounds[2], self.position.x))
-            self.position.y = max(self.bounds[1], min(self.bounds[3], self.position.y))
+            min_x, min_y, max_x, max_y = self.bounds
+            x, y = self.position.x, self.position.y
+            clamped_x = max(min_x, min(max_x, x))
+            clamped_y = max(min_y, min(max_y, y))
+            if clamped_x != x or clamped_y != y:
+                self.position = Vector2(clamped_x, clamped_y)
     
     def world_to_screen(self, world_pos: Vector2) -> Vector2:
         """
@@ -82,16 +96,49 @@ class Camera:
         Returns:
             Position in screen space
         """
-        # Translate to camera-relative position
-        relative_pos = world_pos - self.position
+        # Camera-relative, zoomed, then centered on screen, on plain floats
+        cam = self.position
+        zoom = self.zoom
+        return Vector2((world_pos.x - cam.x) * zoom + self._center_x,
+                       (world_pos.y - cam.y) * zoom + self._center_y)
+    
+    def world_to_screen_xy(self, world_x: float, world_y: float) -> Tuple[int, int]:
+        """
+        Convert world coordinates to integer screen coordinates.
         
-        # Apply zoom
-        screen_pos = relative_pos * self.zoom
+        Same transform as world_to_screen, without building any Vector2.
+        
+        Args:
+            world_x: X position in world space
+            world_y: Y position in world space
+            
+        Returns:
+            (x, y) integer screen position, ready for drawing
+        """
+        cam = self.position
+        zoom = self.zoom
+        return (int((world_x - cam.x) * zoom + self._center_x),
+                int((world_y - cam.y) * zoom + self._center_y))
+    
+    def world_to_screen_batch(self, world_positions: Iterable[Vector2]) -> List[Tuple[int, int]]:
+        """
+        Convert many world positions to integer screen coordinates at once.
         
-        # Translate to screen center
-        screen_pos += Vector2(SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] // 2)
+        The camera transform is read once for the whole batch, and no
+        intermediate Vector2 objects are created.
         
-        return screen_pos
+        Args:
+            world_positions: Positions in world space
+            
+        Returns:
+            List of (x, y) integer screen positions, ready for drawing
+        """
+        cam_x, cam_y = self.position.x, self.position.y
+        zoom = self.zoom
+        offset_x = self._center_x
+        offset_y = self._center_y
+        return [(int((pos.x - cam_x) * zoom + offset_x), int((pos.y - cam_y) * zoom + offset_y))
+                for pos in world_positions]
     
     def screen_to_world(self, screen_pos: Vector2) -> Vector2:
         """
@@ -103,16 +150,12 @@ class Camera:
         Returns:
             Position in world space
         """
-        # Translate from screen center
-        relative_pos = screen_pos - Vector2(SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] // 2)
-        
-        # Apply inverse zoom
-        world_pos = relative_pos / self.zoom
-        
-        # Translate to world position
-        world_pos += self.position
-        
-        return world_pos
+        # Translate from screen center, apply inverse zoom, then translate
+        # to world position
+        cam = self.position
+        inv_zoom = 1.0 / self.zoom
+        return Vector2((screen_pos.x - self._center_x) * inv_zoom + cam.x,
+                       (screen_pos.y - self._center_y) * inv_zoom + cam.y)
     
     def set_position(self, position: Vector2, smooth: bool = True):
         """
@@ -186,10 +229,11 @@ class Camera:
         Returns:
             True if position is visible
         """
-        screen_pos = self.world_to_screen(world_pos)
-        
-        return (0 <= screen_pos.x <= SCREEN_SIZE[0] and 
-                0 <= screen_pos.y <= SCREEN_SIZE[1])
+        # Compare against the visible world rectangle directly rather than
+        # transforming the position to screen space
+        min_x, min_y, max_x, max_y = self.get_visible_bounds()
+        return (min_x <= world_pos.x <= max_x and
+                min_y <= world_pos.y <= max_y)
     
     def get_visible_bounds(self) -> Tuple[float, float, float, float]:
         """
@@ -198,11 +242,13 @@ class Camera:
         Returns:
             Tuple of (min_x, min_y, max_x, max_y) in world space
         """
-        # Convert screen corners to world space
-        top_left = self.screen_to_world(Vector2(0, 0))
-        bottom_right = self.screen_to_world(Vector2(SCREEN_SIZE[0], SCREEN_SIZE[1]))
-        
-        return (top_left.x, top_left.y, bottom_right.x, bottom_right.y)
+        # Screen corners converted to world space, on plain floats
+        cam = self.position
+        inv_zoom = 1.0 / self.zoom
+        return (cam.x - self._center_x * inv_zoom,
+                cam.y - self._center_y * inv_zoom,
+                cam.x + (SCREEN_SIZE[0] - self._center_x) * inv_zoom,
+                cam.y + (SCREEN_SIZE[1] - self._center_y) * inv_zoom)
     
     def get_zoom_level(self) -> float:
         """Get current zoom level."""
@@ -5,10 +5,22 @@ Displays temporary text that floats upward and fades out.
 """
 
 import pygame
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 from ..utils.vector2 import Vector2
 
 
+# Fonts shared by all floating texts, keyed by size
+_FONT_CACHE: Dict[int, pygame.font.Font] = {}
+
+
+def _get_font(size: int) -> pygame.font.Font:
+    """Get the shared font for a size, creating it on first use."""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = _FONT_CACHE[size] = pygame.font.Font(None, size)
+    return font
+
+
 class FloatingText:
     """Individual floating text element."""
     
@@ -26,9 +38,11 @@ class FloatingText:
             velocity = Vector2(0, -30)  # Float upward
         self.velocity = velocity
         
-        # Font setup
+        # Font setup; the text never changes, so it is rasterized once here
+        # and only its alpha is updated while it fades
         self.font_size = font_size
-        self.font = pygame.font.Font(None, font_size)
+        self.font = _get_font(font_size)
+        self.surface = self.font.render(text, True, color)
     
     def update(self, dt: float) -> bool:
         """
@@ -43,8 +57,10 @@ class FloatingText:
         if not self.active:
             return False
         
-        # Update position
-        self.position += self.velocity * dt
+        # Update position in place (the position is this object's own copy)
+        position, velocity = self.position, self.velocity
+        position.x += velocity.x * dt
+        position.y += velocity.y * dt
         
         # Update lifetime
         self.lifetime -= dt
@@ -70,29 +86,33 @@ class FloatingText:
             return
         
         # Convert world position to screen position
-        screen_pos = camera.world_to_screen(self.position)
+        screen_x, screen_y = camera.world_to_screen_xy(self.position.x, self.position.y)
+        self.render_at(screen, screen_x, screen_y)
+    
+    def render_at(self, screen, screen_x: float, screen_y: float):
+        """
+        Render the floating text centered on an already-transformed position.
         
-        # Skip if off-screen
-        if (screen_pos.x < -50 or screen_pos.x > screen.get_width() + 50 or
-            screen_pos.y < -50 or screen_pos.y > screen.get_height() + 50):
+        Args:
+            screen: Surface to draw on
+            screen_x: Screen-space x coordinate
+            screen_y: Screen-space y coordinate
+        """
+        if not self.active:
             return
         
-        # Get alpha for fading
-        alpha = self.get_alpha()
-        
-        # Create text surface with alpha
-        text_surface = self.font.render(self.text, True, self.color)
-        
-        # Create a surface with alpha
-        alpha_surface = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
-        alpha_surface.blit(text_surface, (0, 0))
+        # Skip if off-screen
+        if (screen_x < -50 or screen_x > screen.get_width() + 50 or
+            screen_y < -50 or screen_y > screen.get_height() + 50):
+            return
         
-        # Apply alpha
-        alpha_surface.set_alpha(alpha)
+        # Apply alpha for fading
+        text_surface = self.surface
+        text_surface.set_alpha(self.get_alpha())
         
         # Blit to screen
-        screen.blit(alpha_surface, (screen_pos.x - text_surface.get_width() // 2, 
-                                   screen_pos.y - text_surface.get_height() // 2))
+        screen.blit(text_surface, (screen_x - text_surface.get_width() // 2, 
+                                  screen_y - text_surface.get_height() // 2))
 
 
 class FloatingTextSystem:
@@ -144,8 +164,10 @@ class FloatingTextSystem:
     
     def render(self, screen, camera):
         """Render all floating texts."""
-        for text in self.texts:
-            text.render(screen, camera)
+        # Transform every text position to screen space in one pass
+        screen_positions = camera.world_to_screen_batch([t.position for t in self.texts])
+        for text, (screen_x, screen_y) in zip(self.texts, screen_positions):
+            text.render_at(screen, screen_x, screen_y)
     
     def clear(self):
         """Clear all floating texts."""
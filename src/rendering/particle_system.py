@@ -6,8 +6,40 @@ Provides particle effects for candy dispensing and other visual feedback.
 
 import random
 import math
-from typing import List, Tuple
+import pygame
+from typing import Dict, List, Tuple
 from ..utils.vector2 import Vector2
+from .safe_draw import to_display_format
+
+
+# Particle fade is quantized to 32 alpha levels (alpha >> 3) so every level
+# can have its own pre-faded sprite and all particles go out in one blits call
+PARTICLE_ALPHA_SHIFT = 3
+PARTICLE_ALPHA_LEVELS = 256 >> PARTICLE_ALPHA_SHIFT
+
+
+# Trade particle colors per candy type (economy candy keys)
+TRADE_CANDY_COLORS = {
+    "CHOCOLATE": (139, 69, 19),    # Brown
+    "FRUITY": (255, 192, 203),     # Pink
+    "SOUR": (255, 255, 0),         # Yellow
+    "NOVELTY": (255, 165, 0),      # Orange
+    "HEALTH": (0, 255, 127),       # Green
+    "TRASH": (128, 128, 128)       # Gray
+}
+DEFAULT_TRADE_CANDY_COLOR = (255, 255, 255)  # White
+
+
+# Dispense particle colors per candy type (lowercase dispense names)
+DISPENSE_CANDY_COLORS = {
+    "chocolate": (139, 69, 19),    # Brown
+    "fruity": (255, 192, 203),     # Pink
+    "sour": (255, 255, 0),         # Yellow
+    "mint": (0, 255, 127),         # Green
+    "caramel": (255, 165, 0),      # Orange
+    "licorice": (75, 0, 130)       # Purple
+}
+DEFAULT_DISPENSE_CANDY_COLOR = (255, 255, 0)  # Yellow
 
 
 class Particle:
@@ -34,8 +66,10 @@ class Particle:
         if not self.active:
             return False
         
-        # Update position
-        self.position += self.velocity * dt
+        # Update position in place (the position is this object's own copy)
+        position, velocity = self.position, self.velocity
+        position.x += velocity.x * dt
+        position.y += velocity.y * dt
         
         # Update lifetime
         self.lifetime -= dt
@@ -71,21 +105,23 @@ class ParticleEmitter:
     def emit(self) -> List[Particle]:
         """Emit a burst of particles."""
         particles = []
+        uniform = random.uniform
+        cos, sin = math.cos, math.sin
+        full_turn = 2 * math.pi
+        position, speed, lifetime, color = self.position, self.speed, self.lifetime, self.color
         
         for _ in range(self.particle_count):
             # Random direction within spread
-            angle = random.uniform(0, 2 * math.pi)
-            direction = Vector2(math.cos(angle), math.sin(angle))
+            angle = uniform(0, full_turn)
             
             # Add some randomness to speed
-            particle_speed = self.speed * random.uniform(0.5, 1.5)
-            velocity = direction * particle_speed
+            particle_speed = speed * uniform(0.5, 1.5)
+            velocity = Vector2(cos(angle) * particle_speed, sin(angle) * particle_speed)
             
             # Add some randomness to lifetime
-            particle_lifetime = self.lifetime * random.uniform(0.7, 1.3)
+            particle_lifetime = lifetime * uniform(0.7, 1.3)
             
-            particle = Particle(self.position, velocity, self.color, particle_lifetime)
-            particles.append(particle)
+            particles.append(Particle(position, velocity, color, particle_lifetime))
         
         return particles
 
@@ -96,29 +132,24 @@ class ParticleSystem:
     def __init__(self):
         self.particles: List[Particle] = []
         self.max_particles = 200  # Limit for performance
+        
+        # Pre-drawn particle circles keyed by particle color, one per alpha level
+        self._sprite_cache: Dict[Tuple[int, int, int], List[pygame.Surface]] = {}
     
     def add_particles(self, particles: List[Particle]):
         """Add particles to the system."""
         self.particles.extend(particles)
         
         # Limit total particles
-        if len(self.particles) > self.max_particles:
-            # Remove oldest particles
-            self.particles = self.particles[-self.max_particles:]
+        overflow = len(self.particles) - self.max_particles
+        if overflow > 0:
+            # Remove oldest particles in place (no new list)
+            del self.particles[:overflow]
     
     def emit_candy_particles(self, position: Vector2, candy_type: str = "chocolate"):
         """Emit particles for candy dispensing."""
         # Color based on candy type
-        candy_colors = {
-            "chocolate": (139, 69, 19),    # Brown
-            "fruity": (255, 192, 203),     # Pink
-            "sour": (255, 255, 0),         # Yellow
-            "mint": (0, 255, 127),         # Green
-            "caramel": (255, 165, 0),      # Orange
-            "licorice": (75, 0, 130)       # Purple
-        }
-        
-        color = candy_colors.get(candy_type, (255, 255, 0))  # Default yellow
+        color = DISPENSE_CANDY_COLORS.get(candy_type, DEFAULT_DISPENSE_CANDY_COLOR)
         
         emitter = ParticleEmitter(
             position=position,
@@ -143,6 +174,7 @@ class ParticleSystem:
         
         # Emit particles for each candy type in the trade
         all_trade_items = {**offer, **request}
+        particles = []
         
         for candy_type, quantity in all_trade_items.items():
             # Get color for this candy type
@@ -162,7 +194,10 @@ class ParticleSystem:
                 velocity = direction * random.uniform(50, 100)
                 
                 particle = Particle(start_pos, velocity, color, 2.0)
-                self.particles.append(particle)
+                particles.append(particle)
+        
+        # Added together so the particle limit applies to trades too
+        self.add_particles(particles)
     
     def emit_trade_success_particles(self, position: Vector2):
         """Emit celebration particles for successful trade."""
@@ -181,58 +216,84 @@ class ParticleSystem:
     
     def _get_candy_color(self, candy_type: str) -> Tuple[int, int, int]:
         """Get color for a candy type."""
-        candy_colors = {
-            "CHOCOLATE": (139, 69, 19),    # Brown
-            "FRUITY": (255, 192, 203),     # Pink
-            "SOUR": (255, 255, 0),         # Yellow
-            "NOVELTY": (255, 165, 0),      # Orange
-            "HEALTH": (0, 255, 127),       # Green
-            "TRASH": (128, 128, 128)       # Gray
-        }
-        return candy_colors.get(candy_type, (255, 255, 255))  # Default white
+        return TRADE_CANDY_COLORS.get(candy_type, DEFAULT_TRADE_CANDY_COLOR)
     
     def update(self, dt: float):
         """Update all particles."""
-        # Update particles and remove inactive ones
-        self.particles = [p for p in self.particles if p.update(dt)]
+        # Update particles and compact the survivors to the front of the
+        # same list, then drop the tail of expired ones
+        particles = self.particles
+        alive = 0
+        for particle in particles:
+            if particle.update(dt):
+                particles[alive] = particle
+                alive += 1
+        del particles[alive:]
     
     def render(self, screen, camera):
         """Render all particles."""
-        for particle in self.particles:
-            if not particle.active:
-                continue
-            
-            # Convert world position to screen position
-            screen_pos = camera.world_to_screen(particle.position)
-            
+        particles = [p for p in self.particles if p.active]
+        
+        # Transform every particle to screen space in one pass
+        screen_positions = camera.world_to_screen_batch([p.position for p in particles])
+        max_x = screen.get_width() + 10
+        max_y = screen.get_height() + 10
+        
+        blit_list = []
+        for particle, (screen_x, screen_y) in zip(particles, screen_positions):
             # Skip if off-screen
-            if (screen_pos.x < -10 or screen_pos.x > screen.get_width() + 10 or
-                screen_pos.y < -10 or screen_pos.y > screen.get_height() + 10):
+            if screen_x < -10 or screen_x > max_x or screen_y < -10 or screen_y > max_y:
                 continue
             
-            # Get alpha for fading
-            alpha = particle.get_alpha()
-            
-            # CRITICAL: Validate and clamp all color components
+            # CRITICAL: Validate color
             # Ensure particle.color is valid and has 3 components
-            if not hasattr(particle, 'color') or not particle.color or len(particle.color) < 3:
+            color = getattr(particle, 'color', None)
+            if not color or len(color) < 3:
                 # Skip invalid particles
                 continue
             
-            # Clamp all color components to valid integer range
-            r = max(0, min(255, int(particle.color[0])))
-            g = max(0, min(255, int(particle.color[1])))
-            b = max(0, min(255, int(particle.color[2])))
-            a = max(0, min(255, int(alpha)))
-            
-            # Create surface with alpha and draw RGB-only, apply alpha via set_alpha
-            import pygame
-            particle_surface = pygame.Surface((8, 8), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, (r, g, b), (4, 4), 4)
-            particle_surface.set_alpha(a)
+            # Pick the pre-faded sprite for this color and alpha level;
+            # fully faded particles are not drawn at all
+            level = particle.get_alpha() >> PARTICLE_ALPHA_SHIFT
+            if not level:
+                continue
+            sprites = self._sprite_cache.get(color)
+            if sprites is None:
+                sprites = self._build_sprites(color)
+            blit_list.append((sprites[level], (screen_x - 4, screen_y - 4)))
+        
+        # Submit every particle in a single call
+        if blit_list:
+            screen.blits(blit_list, doreturn=False)
+    
+    def _build_sprites(self, color) -> List[pygame.Surface]:
+        """
+        Draw and cache the particle circle for a color at every alpha level.
+        
+        Args:
+            color: Particle color; components are clamped to 0-255
             
-            # Blit to screen with integer coordinates
-            screen.blit(particle_surface, (int(screen_pos.x - 4), int(screen_pos.y - 4)))
+        Returns:
+            8x8 surfaces with the filled circle, indexed by alpha level
+        """
+        # Clamp all color components to valid integer range
+        r = max(0, min(255, int(color[0])))
+        g = max(0, min(255, int(color[1])))
+        b = max(0, min(255, int(color[2])))
+        
+        # Draw RGB-only, then apply each level's alpha via set_alpha
+        base = pygame.Surface((8, 8), pygame.SRCALPHA)
+        pygame.draw.circle(base, (r, g, b), (4, 4), 4)
+        base = to_display_format(base)
+        
+        sprites = []
+        low_bits = (1 << PARTICLE_ALPHA_SHIFT) - 1
+        for level in range(PARTICLE_ALPHA_LEVELS):
+            sprite = base.copy()
+            sprite.set_alpha((level << PARTICLE_ALPHA_SHIFT) | low_bits)  # Top level is 255
+            sprites.append(sprite)
+        self._sprite_cache[color] = sprites
+        return sprites
     
     def clear(self):
         """Clear all particles."""
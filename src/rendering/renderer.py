@@ -8,16 +8,64 @@ with support for layered rendering and camera systems.
 import pygame
 import math
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from ..entities.base_entity import BaseEntity
-from ..entities.kid import Kid
+from ..entities.kid import Kid, KidState, Mood, PersonalityType
 from ..entities.house import House
 from .camera import Camera
 from .particle_system import ParticleSystem
 from ..core.constants import COLORS, SCREEN_SIZE
 from ..utils.vector2 import Vector2
 from ..ui.inventory_display import InventoryManager
-from .safe_draw import circle as safe_circle, lines as safe_lines
+from .safe_draw import (circle as safe_circle, outlined_circle as safe_outlined_circle,
+                        polylines as safe_polylines, get_glow_surface, to_display_format)
+
+
+# Screen-space margins (pixels) around the view inside which entities are
+# still drawn, so labels and glows at the edge don't pop in and out
+KID_CULL_MARGIN = 40
+HOUSE_CULL_MARGIN = 50  # Covers the largest house glow
+
+# Upper bound on cached text surfaces; labels have small cardinality, the cap
+# only guards against unbounded growth from ever-changing strings
+TEXT_CACHE_SIZE = 512
+
+# Palette entries used on per-entity paths, bound once instead of looked up
+# in COLORS for every entity every frame
+_WHITE = COLORS['WHITE']
+_BLACK = COLORS['BLACK']
+_RED = COLORS['RED']
+_YELLOW = COLORS['YELLOW']
+_GREEN = COLORS['GREEN']
+
+# Kid colors: states take precedence over moods, anything else is white
+_KID_STATE_COLORS = {
+    KidState.FLEEING: _RED,
+    KidState.IN_TRADE: _YELLOW,
+}
+_KID_MOOD_COLORS = {
+    Mood.PANIC: COLORS['ORANGE'],
+    Mood.HAPPY: _GREEN,
+}
+
+# Symbol drawn above a kid for each mood
+_MOOD_SYMBOLS = {
+    Mood.HAPPY: '😊',
+    Mood.NEUTRAL: '😐',
+    Mood.ANXIOUS: '😰',
+    Mood.GREEDY: '😈',
+    Mood.PANIC: '😱'
+}
+
+# Letter drawn on a house for each quality level (1=low, 2=mid, 3=high)
+_QUALITY_LETTERS = {1: "A", 2: "B", 3: "C"}
+
+# Letter drawn above a kid for each personality (others show '?')
+_PERSONALITY_LETTERS = {
+    PersonalityType.VALUE_INVESTOR: "V",
+    PersonalityType.HOARDER: "H",
+    PersonalityType.SOCIAL_TRADER: "S"
+}
 
 
 class Renderer:
@@ -28,14 +76,18 @@ class Renderer:
     layered rendering and camera systems.
     """
     
-    def __init__(self, screen: pygame.Surface):
+    def __init__(self, screen: pygame.Surface, clock: Optional[pygame.time.Clock] = None):
         """
         Initialize the renderer.
         
         Args:
             screen: Pygame screen surface to render to
+            clock: Clock ticked by the game loop, read for the FPS display;
+                without one the renderer ticks its own clock once per frame
         """
         self.screen = screen
+        self._owns_clock = clock is None
+        self.clock = clock or pygame.time.Clock()
         self.camera = Camera(Vector2(1000, 1000), 0.5)  # Center of 2000x2000 world, zoomed out
         
         # Rendering layers
@@ -49,6 +101,9 @@ class Renderer:
         # Sprite management
         self.sprite_cache: Dict[str, pygame.Surface] = {}
         self.font_cache: Dict[tuple, pygame.font.Font] = {}
+        self.text_cache: Dict[tuple, pygame.Surface] = {}  # (text, size, color) -> surface
+        self._background_surface: Optional[pygame.Surface] = None  # Fill + grid, built on demand
+        self._help_surface: Optional[pygame.Surface] = None  # Static help text, built on demand
         
         # Debug overlay
         self.debug_enabled = False
@@ -61,6 +116,10 @@ class Renderer:
         self.inventory_manager = InventoryManager()
         self.inventory_display_enabled = False
         
+        # Glow pulse phases, shared by every glowing entity in a frame
+        self._update_glow_pulses()
+        self._possessed_kid_id: Optional[str] = None  # Refreshed once per frame
+        
     def render_world(self, world, dt: float = 0.0):
         """
         Render the entire game world.
@@ -69,13 +128,19 @@ class Renderer:
             world: GameWorld instance to render
             dt: Delta time for animations
         """
-        # Clear screen
-        self.screen.fill(COLORS['BACKGROUND'])
-        
-        # Store world reference for possession checking
+        # Store world reference for possession checking, and look the
+        # possessed kid up once so other kids skip the glow entirely
         self.current_world = world
-        
-        # Render background layer
+        possession_system = world.possession_system
+        possessed_kid = None
+        if possession_system and possession_system.is_possessing():
+            possessed_kid = possession_system.get_possessed_kid()
+        self._possessed_kid_id = possessed_kid.id if possessed_kid else None
+        self._update_glow_pulses()
+        if self._owns_clock:
+            self.clock.tick()
+        
+        # Render background layer (also clears the screen)
         self._render_background()
         
         # Render world entities
@@ -105,48 +170,90 @@ class Renderer:
             self.inventory_manager.render(self.screen, font)
     
     def _render_background(self):
-        """Render background elements."""
-        # For now, just a simple grid pattern
+        """Render background elements, clearing the whole screen."""
+        # The background is static, so it is drawn once and blitted each frame
+        background = self._background_surface
+        if background is None or background.get_size() != self.screen.get_size():
+            background = self._background_surface = self._build_background()
+        self.screen.blit(background, (0, 0))
+    
+    def _build_background(self) -> pygame.Surface:
+        """Draw the background fill and grid into a screen-sized surface."""
+        # Same pixel format as the screen, so the per-frame blit is a plain copy
+        background = pygame.Surface(self.screen.get_size(), 0, self.screen)
+        background.fill(COLORS['BACKGROUND'])
+        
+        # For now, just a simple grid pattern of one-pixel strips (filled
+        # rather than rasterized as lines)
         grid_size = 50
-        for x in range(0, SCREEN_SIZE[0], grid_size):
-            safe_lines(self.screen, COLORS['DARK_GRAY'], False, [(x, 0), (x, SCREEN_SIZE[1])], 1)
-        for y in range(0, SCREEN_SIZE[1], grid_size):
-            safe_lines(self.screen, COLORS['DARK_GRAY'], False, [(0, y), (SCREEN_SIZE[0], y)], 1)
+        grid_color = COLORS['DARK_GRAY']
+        width, height = SCREEN_SIZE
+        for x in range(0, width, grid_size):
+            background.fill(grid_color, (x, 0, 1, height))
+        for y in range(0, height, grid_size):
+            background.fill(grid_color, (0, y, width, 1))
+        return background
     
     def _render_entities(self, world):
         """Render all world entities."""
+        # Entities outside the visible world rectangle (padded by a
+        # per-type screen margin) are skipped before any transform or draw
+        view_min_x, view_min_y, view_max_x, view_max_y = self.camera.get_visible_bounds()
+        zoom = self.camera.zoom
+        
         # Render houses first (background)
+        margin = HOUSE_CULL_MARGIN / zoom
+        min_x, min_y = view_min_x - margin, view_min_y - margin
+        max_x, max_y = view_max_x + margin, view_max_y + margin
         for house in world.houses:
             if house.active and house.visible:
-                self._render_house(house)
+                pos = house.position
+                if min_x <= pos.x <= max_x and min_y <= pos.y <= max_y:
+                    self._render_house(house)
         
         # Render kids
+        margin = KID_CULL_MARGIN / zoom
+        min_x, min_y = view_min_x - margin, view_min_y - margin
+        max_x, max_y = view_max_x + margin, view_max_y + margin
         for kid in world.kids:
             if kid.active and kid.visible:
-                self._render_kid(kid)
-        
-        # Render trading blocs (visual indicators)
-        for bloc in world.trading_blocs:
-            self._render_trading_bloc(bloc, world.kids)
+                pos = kid.position
+                if min_x <= pos.x <= max_x and min_y <= pos.y <= max_y:
+                    self._render_kid(kid)
+        
+        # Render trading blocs (visual indicators), looking members up by ID.
+        # Each bloc's outline is gathered per color and drawn in one pass
+        # per color
+        if world.trading_blocs:
+            outlines_by_color: Dict[tuple, list] = {}
+            for bloc in world.trading_blocs:
+                self._render_trading_bloc(bloc, world.kids_by_id, outlines_by_color)
+            for color, outlines in outlines_by_color.items():
+                safe_polylines(self.screen, color, True, outlines, 2)
     
     def _render_house(self, house: House):
         """Render a house entity."""
-        # Convert world position to screen position
-        screen_pos = self.camera.world_to_screen(house.position)
+        # Convert world position to (integer) screen position, once for
+        # this house and all its helpers
+        sx, sy = self.camera.world_to_screen_xy(house.position.x, house.position.y)
+        screen_pos = (sx, sy)
         
-        # Draw house glow effect (before house)
-        self._render_house_glow(house, screen_pos)
+        # Draw house glow effect (before house), only for houses that glow
+        cursed = house.is_cursed()
+        blessed = house.is_blessed()
+        if cursed or blessed:
+            self._render_house_glow(house, screen_pos)
         
         # Draw house as a rectangle
         house_rect = pygame.Rect(
-            screen_pos.x - 20, screen_pos.y - 15,
+            sx - 20, sy - 15,
             40, 30
         )
         
         # Choose color based on house state and quality
-        if house.is_blessed():
+        if blessed:
             color = (100, 255, 100)  # Green for blessed
-        elif house.is_cursed():
+        elif cursed:
             color = (255, 100, 100)  # Red for cursed
         else:
             # Color based on quality level
@@ -157,13 +264,13 @@ class Renderer:
             else:  # High quality
                 color = (255, 215, 0)  # Gold
         
-        pygame.draw.rect(self.screen, color, house_rect)
-        pygame.draw.rect(self.screen, COLORS['BLACK'], house_rect, 2)
+        # Solid axis-aligned fills go through Surface.fill; only the border is drawn
+        self.screen.fill(color, house_rect)
+        pygame.draw.rect(self.screen, _BLACK, house_rect, 2)
         
         # Draw house quality indicator (letter)
-        font = self._get_font(16)
-        quality_letter = chr(ord('A') + house.quality - 1)  # A, B, C for quality 1, 2, 3
-        text_surface = font.render(quality_letter, True, COLORS['WHITE'])
+        quality_letter = _QUALITY_LETTERS.get(house.quality, "?")
+        text_surface = self._get_text_surface(quality_letter, 16, _WHITE)
         text_rect = text_surface.get_rect(center=house_rect.center)
         self.screen.blit(text_surface, text_rect)
         
@@ -173,23 +280,24 @@ class Renderer:
     
     def _render_kid(self, kid: Kid):
         """Render a kid entity."""
-        # Convert world position to screen position
-        screen_pos = self.camera.world_to_screen(kid.position)
+        # Convert world position to (integer) screen position, once for
+        # this kid and all its helpers
+        sx, sy = self.camera.world_to_screen_xy(kid.position.x, kid.position.y)
+        screen_pos = (sx, sy)
         
         # Draw kid as a colored circle
         color = self._get_kid_color(kid)
         radius = 8
         
         # Draw possession glow effect
-        self._render_possession_glow(kid, screen_pos)
+        if kid.id == self._possessed_kid_id:
+            self._render_possession_glow(kid, screen_pos)
         
-        safe_circle(self.screen, color, screen_pos.to_int_tuple(), radius)
-        safe_circle(self.screen, (0, 0, 0), screen_pos.to_int_tuple(), radius, 2)
+        safe_outlined_circle(self.screen, color, (0, 0, 0), screen_pos, radius, 2)
         
         # Draw kid ID
-        font = self._get_font(12)
-        text_surface = font.render(kid.id, True, (255, 255, 255))
-        text_rect = text_surface.get_rect(center=(screen_pos.x, screen_pos.y - 20))
+        text_surface = self._get_text_surface(kid.id, 12, (255, 255, 255))
+        text_rect = text_surface.get_rect(center=(sx, sy - 20))
         self.screen.blit(text_surface, text_rect)
         
         # Draw inventory count
@@ -200,36 +308,22 @@ class Renderer:
     
     def _get_kid_color(self, kid: Kid) -> tuple:
         """Get color for a kid based on their state."""
-        if kid.state.name == "FLEEING":
-            return COLORS['RED']
-        elif kid.state.name == "IN_TRADE":
-            return COLORS['YELLOW']
-        elif kid.mood.name == "PANIC":
-            return COLORS['ORANGE']
-        elif kid.mood.name == "HAPPY":
-            return COLORS['GREEN']
-        else:
-            return COLORS['WHITE']
+        color = _KID_STATE_COLORS.get(kid.state)
+        if color is None:
+            color = _KID_MOOD_COLORS.get(kid.mood, _WHITE)
+        return color
     
-    def _render_mood_indicator(self, kid: Kid, screen_pos):
+    def _render_mood_indicator(self, kid: Kid, screen_pos: Tuple[int, int]):
         """Render mood indicator above kid."""
-        mood_symbols = {
-            'HAPPY': '😊',
-            'NEUTRAL': '😐',
-            'ANXIOUS': '😰',
-            'GREEDY': '😈',
-            'PANIC': '😱'
-        }
-        
-        symbol = mood_symbols.get(kid.mood.name, '?')
-        font = self._get_font(16)
-        text_surface = font.render(symbol, True, COLORS['WHITE'])
+        x, y = screen_pos
+        symbol = _MOOD_SYMBOLS.get(kid.mood, '?')
+        text_surface = self._get_text_surface(symbol, 16, _WHITE)
         
         # Position above kid
-        text_rect = text_surface.get_rect(center=(screen_pos.x, screen_pos.y - 20))
+        text_rect = text_surface.get_rect(center=(x, y - 20))
         self.screen.blit(text_surface, text_rect)
     
-    def _render_inventory_count(self, kid: Kid, screen_pos):
+    def _render_inventory_count(self, kid: Kid, screen_pos: Tuple[int, int]):
         """Render inventory count as text."""
         if not kid.inventory:
             return
@@ -240,13 +334,12 @@ class Renderer:
             return
         
         # Draw candy count
-        font = self._get_font(10)
-        text = f"{total_candy}"
-        text_surface = font.render(text, True, (255, 255, 255))
-        text_rect = text_surface.get_rect(center=(screen_pos.x, screen_pos.y + 15))
+        x, y = screen_pos
+        text_surface = self._get_text_surface(f"{total_candy}", 10, (255, 255, 255))
+        text_rect = text_surface.get_rect(center=(x, y + 15))
         self.screen.blit(text_surface, text_rect)
     
-    def _render_inventory_indicator(self, kid: Kid, screen_pos):
+    def _render_inventory_indicator(self, kid: Kid, screen_pos: Tuple[int, int]):
         """Render small inventory indicator."""
         if not kid.inventory:
             return
@@ -257,24 +350,32 @@ class Renderer:
             return
         
         # Draw small indicator
+        x, y = screen_pos
         indicator_rect = pygame.Rect(
-            screen_pos.x - 12, screen_pos.y + 12,
+            x - 12, y + 12,
             24, 4
         )
         
         # Color based on total candy value
         if total_candy > 10:
-            color = COLORS['GREEN']
+            color = _GREEN
         elif total_candy > 5:
-            color = COLORS['YELLOW']
+            color = _YELLOW
         else:
-            color = COLORS['RED']
+            color = _RED
         
-        pygame.draw.rect(self.screen, color, indicator_rect)
+        self.screen.fill(color, indicator_rect)
+    
+    def _update_glow_pulses(self):
+        """Compute this frame's glow pulse phases, once for all entities."""
+        now = time.time()
+        # 0-1 pulsing, quantized to eighths so cached glow surfaces are reused
+        self._house_pulse = round((math.sin(now * 3) + 1) * 4) / 8
+        self._possession_pulse = round((math.sin(now * 4) + 1) * 4) / 8  # Faster pulse
     
-    def _render_house_glow(self, house: House, screen_pos: Vector2):
+    def _render_house_glow(self, house: House, screen_pos: Tuple[int, int]):
         """Render glow effect for cursed/blessed houses."""
-        pulse = (math.sin(time.time() * 3) + 1) / 2  # 0-1 pulsing
+        pulse = self._house_pulse
         
         # Determine glow color based on house state
         if house.is_cursed() and house.is_blessed():
@@ -290,56 +391,56 @@ class Renderer:
         else:
             return
         
-        # Multi-layer glow
+        # Multi-layer glow, pre-composited into one cached surface
+        layers = []
         for i in range(3):
             alpha = max(0, min(255, 80 - (i * 25)))  # Clamp alpha to 0-255
             radius = glow_radius + (i * 5)
             
             # CRITICAL: Ensure radius fits within surface
-            # Radius must be less than surface_size/2 to fit inside
-            # Use a safe buffer to prevent edge cases
             max_radius = 45  # Safe maximum radius
-            radius = min(radius, max_radius)
-            
-            # Surface size must be at least 2*radius + 4 for safety margins
-            surface_size = max(2 * radius + 4, 4)
-            
-            # Ensure color components are valid integers in 0-255 range
-            r = max(0, min(255, int(glow_color[0])))
-            g = max(0, min(255, int(glow_color[1])))
-            b = max(0, min(255, int(glow_color[2])))
-            a = max(0, min(255, int(alpha)))
-            
-            glow_surface = pygame.Surface((surface_size, surface_size), pygame.SRCALPHA)
-            center_pos = (surface_size // 2, surface_size // 2)
-            # Draw RGB-only, then apply alpha to the surface
-            pygame.draw.circle(glow_surface, (r, g, b), center_pos, radius)
-            glow_surface.set_alpha(a)
-            glow_rect = glow_surface.get_rect(center=screen_pos.to_int_tuple())
-            self.screen.blit(glow_surface, glow_rect)
-    
-    def _render_trading_bloc(self, bloc, kids: List[Kid]):
-        """Render trading bloc visual indicators."""
+            layers.append((alpha, min(radius, max_radius)))
+        
+        x, y = screen_pos
+        glow_surface = get_glow_surface(glow_color, layers)
+        self.screen.blit(glow_surface, glow_surface.get_rect(center=(int(x), int(y))))
+    
+    def _render_trading_bloc(self, bloc, kid_by_id: Dict[str, Kid],
+                             outlines_by_color: Dict[tuple, list]):
+        """
+        Collect a trading bloc's outline for batched drawing.
+        
+        Args:
+            bloc: Trading bloc to draw
+            kid_by_id: Kids keyed by ID; inactive kids are skipped
+            outlines_by_color: Screen-space closed polylines keyed by line
+                color; this bloc's outline is appended to it
+        """
         if not bloc.members:
             return
         
         # Get member positions
         member_positions = []
         for kid_id in bloc.members:
-            kid = next((k for k in kids if k.id == kid_id), None)
-            if kid and kid.active:
+            kid = kid_by_id.get(kid_id)
+            if kid is not None and kid.active:
                 member_positions.append(kid.position)
         
         if len(member_positions) < 2:
             return
         
-        # Draw connections between members
-        for i, pos1 in enumerate(member_positions):
-            for pos2 in member_positions[i+1:]:
-                screen_pos1 = self.camera.world_to_screen(pos1)
-                screen_pos2 = self.camera.world_to_screen(pos2)
-                
-                safe_lines(self.screen, bloc.color, False, [screen_pos1.to_int_tuple(), screen_pos2.to_int_tuple()], 2)
+        # Skip the whole bloc when the box around its members misses the view
+        view_min_x, view_min_y, view_max_x, view_max_y = self.camera.get_visible_bounds()
+        xs = [pos.x for pos in member_positions]
+        ys = [pos.y for pos in member_positions]
+        if (max(xs) < view_min_x or min(xs) > view_max_x or
+                max(ys) < view_min_y or min(ys) > view_max_y):
+            return
+        
+        # Connect the members in join order as one closed loop, so each
+        # member is linked to its neighbours with M lines rather than M*(M-1)/2
+        screen_positions = self.camera.world_to_screen_batch(member_positions)
+        outlines_by_color.setdefault(tuple(bloc.color), []).append(screen_positions)
     
     def _render_effects(self):
         """Render visual effects."""
@@ -357,6 +458,28 @@ class Renderer:
             self.font_cache[size] = pygame.font.Font(None, size)
         return self.font_cache[size]
     
+    def _get_text_surface(self, text: str, size: int, color: tuple) -> pygame.Surface:
+        """
+        Get rendered text, rasterizing it only the first time it is needed.
+        
+        Args:
+            text: Text to render
+            size: Font size
+            color: Text color
+            
+        Returns:
+            Antialiased text surface (shared; do not modify)
+        """
+        key = (text, size, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            if len(self.text_cache) >= TEXT_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self.text_cache[next(iter(self.text_cache))]
+            surface = to_display_format(self._get_font(size).render(text, True, color))
+            self.text_cache[key] = surface
+        return surface
+    
     def set_camera(self, camera: Camera):
         """Set the camera for rendering."""
         self.camera = camera
@@ -367,31 +490,33 @@ class Renderer:
     
     def _render_debug_overlay(self, world):
         """Render debug information overlay."""
+        # Lines that change every few frames (FPS, particle and cooldown
+        # counts) are rasterized directly; the rest come from the text cache
         font = self._get_font(14)
         y_offset = 10
         
         # FPS counter
-        fps_text = f"FPS: {pygame.time.Clock().get_fps():.1f}"
+        fps_text = f"FPS: {self.clock.get_fps():.1f}"
         fps_surface = font.render(fps_text, True, (255, 255, 0))
         self.screen.blit(fps_surface, (10, y_offset))
         y_offset += 20
         
         # Kid count
         kid_text = f"Kids: {len(world.kids)}"
-        kid_surface = font.render(kid_text, True, (255, 255, 0))
+        kid_surface = self._get_text_surface(kid_text, 14, (255, 255, 0))
         self.screen.blit(kid_surface, (10, y_offset))
         y_offset += 20
         
         # House count
         house_text = f"Houses: {len(world.houses)}"
-        house_surface = font.render(house_text, True, (255, 255, 0))
+        house_surface = self._get_text_surface(house_text, 14, (255, 255, 0))
         self.screen.blit(house_surface, (10, y_offset))
         y_offset += 20
         
         # Pathfinding info
         if world.pathfinding_manager:
             path_text = f"Pathfinding: Active"
-            path_surface = font.render(path_text, True, (255, 255, 0))
+            path_surface = self._get_text_surface(path_text, 14, (255, 255, 0))
             self.screen.blit(path_surface, (10, y_offset))
             y_offset += 20
         
@@ -415,31 +540,27 @@ class Renderer:
             personality_counts[personality] = personality_counts.get(personality, 0) + 1
         
         personality_text = "Personalities: " + ", ".join([f"{k}: {v}" for k, v in personality_counts.items()])
-        personality_surface = font.render(personality_text, True, (255, 255, 0))
+        personality_surface = self._get_text_surface(personality_text, 14, (255, 255, 0))
         self.screen.blit(personality_surface, (10, y_offset))
         y_offset += 20
         
         # Render kid paths
-        for kid in world.kids:
-            if kid.current_path and len(kid.current_path) > 1:
-                self._render_kid_path(kid)
+        self._render_kid_paths(world.kids)
     
-    def _render_kid_path(self, kid):
-        """Render a kid's current path."""
-        if not kid.current_path or len(kid.current_path) < 2:
-            return
+    def _render_kid_paths(self, kids: List[Kid]):
+        """Render the current paths of the given kids."""
+        # Convert every path to screen coordinates
+        screen_paths = []
+        for kid in kids:
+            if kid.current_path and len(kid.current_path) > 1:
+                screen_paths.append((kid, self.camera.world_to_screen_batch(kid.current_path)))
         
-        # Convert path to screen coordinates
-        screen_path = []
-        for waypoint in kid.current_path:
-            screen_pos = self.camera.world_to_screen(waypoint)
-            screen_path.append(screen_pos.to_int_tuple())
+        if not screen_paths:
+            return
         
-        # Draw path as connected lines
-        if len(screen_path) > 1:
-            pygame.draw.lines(self.screen, (0, 255, 255), False, screen_path, 2)
-            
-            # Draw waypoints
+        # Draw all paths as connected lines in one batch, then the waypoints on top
+        safe_polylines(self.screen, (0, 255, 255), False, [path for _, path in screen_paths], 2)
+        for kid, screen_path in screen_paths:
             for i, point in enumerate(screen_path):
                 color = (255, 0, 0) if i == kid.path_index else (0, 255, 255)
                 safe_circle(self.screen, color, point, 3)
@@ -454,14 +575,18 @@ class Renderer:
     
     def _render_help_overlay(self):
         """Render help overlay with controls."""
+        # The help text never changes, so it is drawn once and blitted each frame
+        if self._help_surface is None:
+            self._help_surface = self._build_help_overlay()
+        self.screen.blit(self._help_surface, (0, 0))
+    
+    def _build_help_overlay(self) -> pygame.Surface:
+        """Draw the help text into a transparent surface."""
         font = self._get_font(16)
-        y_offset = 10
         
         # Help title
         title_text = "Candy Capitalism - Controls"
         title_surface = font.render(title_text, True, (255, 255, 0))
-        self.screen.blit(title_surface, (10, y_offset))
-        y_offset += 30
         
         # Camera controls
         controls = [
@@ -482,65 +607,63 @@ class Renderer:
             "  ESC - Quit"
         ]
         
+        # Lay the lines out first, then size the surface to fit them
+        placed = [(title_surface, 10)]
+        y_offset = 10 + 30
         for control in controls:
             if control == "":
                 y_offset += 10
                 continue
             
             color = (255, 255, 255) if control.endswith(":") else (200, 200, 200)
-            text_surface = font.render(control, True, color)
-            self.screen.blit(text_surface, (10, y_offset))
+            placed.append((font.render(control, True, color), y_offset))
             y_offset += 20
+        
+        width = 10 + max(text_surface.get_width() for text_surface, _ in placed)
+        height = max(y + text_surface.get_height() for text_surface, y in placed)
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        for text_surface, y in placed:
+            # Lines don't overlap; MAX copies each one exactly onto the clear surface
+            overlay.blit(text_surface, (10, y), special_flags=pygame.BLEND_RGBA_MAX)
+        return to_display_format(overlay)
     
-    def _render_house_cooldown(self, house: House, screen_pos: Vector2):
+    def _render_house_cooldown(self, house: House, screen_pos: Tuple[int, int]):
         """Render house cooldown indicator."""
         # Draw cooldown progress bar above house
+        x, y = screen_pos
         progress = house.get_cooldown_progress()
         bar_width = 30
         bar_height = 4
-        bar_x = screen_pos.x - bar_width // 2
-        bar_y = screen_pos.y - 25
+        bar_x = x - bar_width // 2
+        bar_y = y - 25
         
         # Background (empty)
-        pygame.draw.rect(self.screen, (100, 100, 100), 
-                        (bar_x, bar_y, bar_width, bar_height))
+        self.screen.fill((100, 100, 100), (bar_x, bar_y, bar_width, bar_height))
         
         # Progress fill
         fill_width = int(bar_width * progress)
         if fill_width > 0:
             color = (0, 255, 0) if progress > 0.8 else (255, 255, 0) if progress > 0.4 else (255, 0, 0)
-            pygame.draw.rect(self.screen, color, 
-                           (bar_x, bar_y, fill_width, bar_height))
+            self.screen.fill(color, (bar_x, bar_y, fill_width, bar_height))
         
         # Cooldown text
         if house.dispense_cooldown > 0:
-            font = self._get_font(10)
             cooldown_text = f"{house.dispense_cooldown:.1f}s"
-            text_surface = font.render(cooldown_text, True, (255, 255, 255))
-            text_rect = text_surface.get_rect(center=(screen_pos.x, bar_y - 8))
+            text_surface = self._get_text_surface(cooldown_text, 10, (255, 255, 255))
+            text_rect = text_surface.get_rect(center=(x, bar_y - 8))
             self.screen.blit(text_surface, text_rect)
     
-    def _render_personality_indicator(self, kid: Kid, screen_pos: Vector2):
+    def _render_personality_indicator(self, kid: Kid, screen_pos: Tuple[int, int]):
         """Render personality indicator above kid."""
-        # Personality letter mapping
-        personality_letters = {
-            "VALUE_INVESTOR": "V",
-            "FOMO_CHASER": "F", 
-            "HOARDER": "H",
-            "DIVERSIFIER": "D",
-            "SOCIAL_TRADER": "S"
-        }
-        
-        letter = personality_letters.get(kid.personality.name, "?")
+        letter = _PERSONALITY_LETTERS.get(kid.personality, "?")
         
         # Draw background circle
-        circle_pos = (int(screen_pos.x), int(screen_pos.y - 35))
-        safe_circle(self.screen, (0, 0, 0), circle_pos, 8)
-        safe_circle(self.screen, (255, 255, 255), circle_pos, 8, 2)
+        x, y = screen_pos
+        circle_pos = (int(x), int(y - 35))
+        safe_outlined_circle(self.screen, (0, 0, 0), (255, 255, 255), circle_pos, 8, 2)
         
         # Draw letter
-        font = self._get_font(12)
-        text_surface = font.render(letter, True, (255, 255, 255))
+        text_surface = self._get_text_surface(letter, 12, (255, 255, 255))
         text_rect = text_surface.get_rect(center=circle_pos)
         self.screen.blit(text_surface, text_rect)
     
@@ -564,7 +687,7 @@ class Renderer:
         """Select a kid to show inventory for."""
         self.inventory_manager.select_kid(kid)
     
-    def _render_possession_glow(self, kid: Kid, screen_pos: Vector2):
+    def _render_possession_glow(self, kid: Kid, screen_pos: Tuple[int, int]):
         """Render possession glow effect around possessed kid."""
         # Check if this kid is possessed
         if not hasattr(self, 'current_world') or not self.current_world:
@@ -579,7 +702,7 @@ class Renderer:
             return
         
         # Red pulsing glow for possessed kids
-        pulse = (math.sin(time.time() * 4) + 1) / 2  # Faster pulse
+        pulse = self._possession_pulse
         base_radius = 15
         glow_radius = base_radius + int(pulse * 5)  # Pulsing size
         
@@ -588,35 +711,24 @@ class Renderer:
         b = int(80 + pulse * 80)
         glow_color = (255, min(255, g), min(255, b))  # Clamp RGB values to 0-255
         
-        # Draw multiple circles for glow effect
+        # Multiple circles for glow effect, pre-composited into one cached surface
+        layers = []
         for i in range(3):
             alpha = max(0, min(255, 120 - (i * 35)))  # Clamp alpha to 0-255
             radius = glow_radius + (i * 3)
             
             # CRITICAL: Ensure radius fits within surface
             max_radius = 25  # Safe maximum radius for possession glow
-            radius = min(radius, max_radius)
-            
-            # Surface size must be at least 2*radius + 4 for safety margins
-            surface_size = max(2 * radius + 4, 4)
-            
-            # Ensure color components are valid integers in 0-255 range
-            r = max(0, min(255, int(glow_color[0])))
-            g = max(0, min(255, int(glow_color[1])))
-            b = max(0, min(255, int(glow_color[2])))
-            a = max(0, min(255, int(alpha)))
-            
-            glow_surface = pygame.Surface((surface_size, surface_size), pygame.SRCALPHA)
-            center_pos = (surface_size // 2, surface_size // 2)
-            # Draw RGB-only, then apply alpha to the surface
-            pygame.draw.circle(glow_surface, (r, g, b), center_pos, radius)
-            glow_surface.set_alpha(a)
-            
-            # Blit to screen
-            glow_rect = glow_surface.get_rect(center=screen_pos.to_int_tuple())
-            self.screen.blit(glow_surface, glow_rect)
+            layers.append((alpha, min(radius, max_radius)))
+        
+        x, y = screen_pos
+        glow_surface = get_glow_surface(glow_color, layers)
+        self.screen.blit(glow_surface, glow_surface.get_rect(center=(int(x), int(y))))
     
     def clear_cache(self):
         """Clear sprite and font caches."""
         self.sprite_cache.clear()
         self.font_cache.clear()
+        self.text_cache.clear()
+        self._background_surface = None
+        self._help_surface = None
@@ -3,12 +3,21 @@ Safe drawing helpers for pygame.
 
 Clamps color values, enforces integer coordinates, and guards against
 invalid arguments that can cause runtime crashes on some platforms.
+Draws that could not produce any pixels (zero radius, too few points)
+return before reaching pygame.
 """
 
-from typing import Sequence, Tuple
+from typing import Dict, Sequence, Tuple
 import pygame
 
 
+# Pre-rendered glows keyed by ((r, g, b), ((alpha, radius), ...)). Glows pulse
+# through a small set of quantized radii and colors, so few keys are live;
+# the cap only guards against unbounded growth.
+GLOW_CACHE_SIZE = 256
+_GLOW_CACHE: Dict[tuple, pygame.Surface] = {}
+
+
 def _clamp_color(color: Sequence[int]) -> Tuple[int, int, int]:
     r = 0 if len(color) < 1 else int(color[0])
     g = 0 if len(color) < 2 else int(color[1])
@@ -19,12 +28,22 @@ def _clamp_color(color: Sequence[int]) -> Tuple[int, int, int]:
     return (r, g, b)
 
 
+def to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    # Per-pixel-alpha copy in the display's pixel format, so later blits skip
+    # per-pixel conversion; unchanged when no display mode is set (headless)
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha()
+
+
 def circle(surface: pygame.Surface, color: Sequence[int], center, radius: int, width: int = 0):
     try:
         rgb = _clamp_color(color)
         cx = int(center[0])
         cy = int(center[1])
-        r = max(0, int(radius))
+        r = int(radius)
+        if r <= 0:
+            return
         w = max(0, int(width))
         pygame.draw.circle(surface, rgb, (cx, cy), r, w)
     except Exception:
@@ -33,6 +52,23 @@ def circle(surface: pygame.Surface, color: Sequence[int], center, radius: int, w
         return
 
 
+def outlined_circle(surface: pygame.Surface, fill: Sequence[int], outline: Sequence[int],
+                    center, radius: int, width: int = 1):
+    # Filled circle plus its border, validating the shared arguments once
+    try:
+        fill_rgb = _clamp_color(fill)
+        outline_rgb = _clamp_color(outline)
+        c = (int(center[0]), int(center[1]))
+        r = int(radius)
+        if r <= 0:
+            return
+        w = max(0, int(width))
+        pygame.draw.circle(surface, fill_rgb, c, r)
+        pygame.draw.circle(surface, outline_rgb, c, r, w)
+    except Exception:
+        return
+
+
 def rect(surface: pygame.Surface, color: Sequence[int], rect, width: int = 0):
     try:
         rgb = _clamp_color(color)
@@ -53,17 +89,63 @@ def lines(surface: pygame.Surface, color: Sequence[int], closed: bool, points, w
     try:
         rgb = _clamp_color(color)
         int_points = [(int(x), int(y)) for (x, y) in points]
+        if len(int_points) < 2:
+            return
         pygame.draw.lines(surface, rgb, bool(closed), int_points, max(1, int(width)))
     except Exception:
         return
 
 
+def polylines(surface: pygame.Surface, color: Sequence[int], closed: bool, point_lists, width: int = 1):
+    # Batch of integer-point polylines sharing one color; the color and
+    # width are validated once for the whole batch
+    try:
+        rgb = _clamp_color(color)
+        closed = bool(closed)
+        w = max(1, int(width))
+        draw_lines = pygame.draw.lines
+        for points in point_lists:
+            if len(points) >= 2:
+                draw_lines(surface, rgb, closed, points, w)
+    except Exception:
+        return
+
+
 def polygon(surface: pygame.Surface, color: Sequence[int], points, width: int = 0):
     try:
         rgb = _clamp_color(color)
         int_points = [(int(x), int(y)) for (x, y) in points]
+        if len(int_points) < 3:
+            return
         pygame.draw.polygon(surface, rgb, int_points, max(0, int(width)))
     except Exception:
         return
 
 
+def get_glow_surface(color: Sequence[int], layers: Sequence[Tuple[int, int]]) -> pygame.Surface:
+    # Concentric same-color discs, given as (alpha, radius) pairs, baked into
+    # one per-pixel-alpha surface. Each pixel gets the alpha the discs covering
+    # it would build up if blitted one after another, so a single blit of the
+    # result looks like the whole stack.
+    # Shared surface: callers blit it and must not draw on it
+    rgb = _clamp_color(color)
+    discs = tuple(sorted(((max(0, min(255, int(a))), max(0, int(r))) for a, r in layers),
+                         key=lambda disc: disc[1], reverse=True))
+    key = (rgb, discs)
+    surface = _GLOW_CACHE.get(key)
+    if surface is None:
+        if len(_GLOW_CACHE) >= GLOW_CACHE_SIZE:
+            _GLOW_CACHE.pop(next(iter(_GLOW_CACHE)))
+        # Surface must be at least 2*radius + 4 for safety margins
+        size = max(2 * discs[0][1] + 4, 4) if discs else 4
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        center = (size // 2, size // 2)
+        # Largest disc first; each smaller disc overwrites the middle with the
+        # combined alpha of every disc that covers it
+        transparency = 1.0
+        for a, r in discs:
+            transparency *= 1.0 - a / 255.0
+            pygame.draw.circle(surface, (rgb[0], rgb[1], rgb[2], round(255 * (1.0 - transparency))), center, r)
+        surface = to_display_format(surface)
+        _GLOW_CACHE[key] = surface
+    return surface
@@ -44,6 +44,7 @@ class Economy:
         history_window = self.settings.get('market_history_window', 20)
         self.trade_history: Deque[Trade] = deque(maxlen=history_window)
         self.market_prices: Dict[str, float] = {}
+        self._prices_dirty = False  # Set when trade_history changes
         
         # Price discovery
         self.discovery_active = True
@@ -118,28 +119,28 @@ class Economy:
     
     def _calculate_market_prices(self):
         """Calculate market price as weighted average of recent trades."""
-        trades_by_candy = {}
+        # Prices only move when a trade is recorded, so skip the scan on
+        # the (common) frames where the history is unchanged
+        if not self._prices_dirty:
+            return
+        self._prices_dirty = False
         
+        # Single pass accumulating [weighted_sum, weight_sum, count] per
+        # candy; the nth trade of a candy in the window has weight 1 + 0.1n,
+        # so more recent trades have higher weight
+        totals: Dict[str, List[float]] = {}
         for trade in self.trade_history:
-            candy_type = trade.candy_type
-            if candy_type not in trades_by_candy:
-                trades_by_candy[candy_type] = []
-            trades_by_candy[candy_type].append(trade.price)
+            acc = totals.get(trade.candy_type)
+            if acc is None:
+                acc = totals[trade.candy_type] = [0.0, 0.0, 0]
+            weight = 1.0 + acc[2] * 0.1
+            acc[0] += trade.price * weight
+            acc[1] += weight
+            acc[2] += 1
         
-        for candy_type, prices in trades_by_candy.items():
-            if not prices:
-                continue
-            
-            # Weighted average, more recent trades have higher weight
-            weights = [1.0 + i * 0.1 for i in range(len(prices))]
-            try:
-                import numpy as np
-                self.market_prices[candy_type] = np.average(prices, weights=weights)
-            except ImportError:
-                # Fallback if numpy not available
-                weighted_sum = sum(p * w for p, w in zip(prices, weights))
-                weight_sum = sum(weights)
-                self.market_prices[candy_type] = weighted_sum / weight_sum
+        market_prices = self.market_prices
+        for candy_type, (weighted_sum, weight_sum, _) in totals.items():
+            market_prices[candy_type] = weighted_sum / weight_sum
     
     def _update_discovery(self, dt: float):
         """Gradually converge believed values toward real values."""
@@ -184,6 +185,7 @@ class Economy:
         """
         trade = Trade(candy_type, price, kid_a_id, kid_b_id, time.time())
         self.trade_history.append(trade)
+        self._prices_dirty = True
     
     def get_market_price(self, candy_type: str) -> float:
         """
@@ -5,6 +5,7 @@ Central hub that manages all game entities and coordinates system updates
 with tiered update frequencies for optimal performance.
 """
 
+import random
 from typing import List, Dict, Any, Optional
 from ..entities.kid import Kid
 from ..entities.house import House
@@ -29,6 +30,7 @@ class GameWorld:
         """Initialize the game world."""
         # Entity collections
         self.kids: List[Kid] = []
+        self._kids_by_id: Dict[str, Kid] = {}  # Kept in step with self.kids
         self.houses: List[House] = []
         self.trading_blocs: List[TradingBloc] = []
         
@@ -41,13 +43,18 @@ class GameWorld:
         self.event_system = None  # Event system
         self.combo_detector = None  # Combo detection system
         
+        # Shared random source for AI decisions (seeded along with the map)
+        self.rng = random.Random()
+        
         # Spatial partitioning for optimization
         self.spatial_grid = SpatialGrid(cell_size=100)
+        self.collision_grid = SpatialGrid(cell_size=30)  # Kids only, sized per frame
         
         # Timing
         self.game_time = 0.0
-        self.ai_tick_timer = 0.0
-        self.ai_tick_rate = 2.0  # AI updates every 2 seconds
+        self.ai_tick_rate = 2.0  # Each kid's AI updates every 2 seconds
+        self._ai_cursor = 0  # Next kid to tick in the round-robin schedule
+        self._ai_budget = 0.0  # Fractional AI ticks owed to the schedule
         
         # World state
         self.active = True
@@ -76,10 +83,7 @@ class GameWorld:
         self._update_spatial_grid()
         
         # AI tick (not every frame for performance)
-        self.ai_tick_timer += dt
-        if self.ai_tick_timer >= self.ai_tick_rate:
-            self.ai_tick_timer = 0.0
-            self._update_ai()
+        self._update_ai(dt)
         
         # Update entities (movement, animations)
         self._update_entities(dt, renderer)
@@ -104,11 +108,31 @@ class GameWorld:
             if house.active:
                 self.spatial_grid.add(house, house.position)
     
-    def _update_ai(self):
-        """Heavy AI logic runs at reduced rate."""
-        for kid in self.kids:
+    def _update_ai(self, dt: float):
+        """
+        Heavy AI logic runs at reduced rate.
+        
+        Ticks are spread round-robin across frames so every kid still thinks
+        once per ai_tick_rate, without the whole population spiking together.
+        """
+        kids = self.kids
+        count = len(kids)
+        if not count:
+            return
+        
+        self._ai_budget += count * dt / self.ai_tick_rate
+        ticks = int(self._ai_budget)
+        if ticks <= 0:
+            return
+        self._ai_budget -= ticks
+        
+        cursor = self._ai_cursor % count
+        for _ in range(min(ticks, count)):
+            kid = kids[cursor]
             if kid.active:
                 kid.ai_tick(self)
+            cursor = (cursor + 1) % count
+        self._ai_cursor = cursor
     
     def _update_entities(self, dt: float, renderer=None):
         """Update all entities."""
@@ -172,6 +196,7 @@ class GameWorld:
     def add_kid(self, kid: Kid):
         """Add a kid to the world."""
         self.kids.append(kid)
+        self._kids_by_id.setdefault(kid.id, kid)
     
     def add_house(self, house: House):
         """Add a house to the world."""
@@ -180,6 +205,7 @@ class GameWorld:
     def remove_kid(self, kid_id: str):
         """Remove a kid from the world."""
         self.kids = [kid for kid in self.kids if kid.id != kid_id]
+        self._kids_by_id.pop(kid_id, None)
     
     def remove_house(self, house_id: str):
         """Remove a house from the world."""
@@ -187,10 +213,12 @@ class GameWorld:
     
     def get_kid_by_id(self, kid_id: str) -> Optional[Kid]:
         """Get a kid by ID."""
-        for kid in self.kids:
-            if kid.id == kid_id:
-                return kid
-        return None
+        return self._kids_by_id.get(kid_id)
+    
+    @property
+    def kids_by_id(self) -> Dict[str, Kid]:
+        """Kids keyed by ID (read-only view; use add_kid/remove_kid to change)."""
+        return self._kids_by_id
     
     def get_house_by_id(self, house_id: str) -> Optional[House]:
         """Get a house by ID."""
@@ -225,11 +253,13 @@ class GameWorld:
     def reset(self):
         """Reset the game world to initial state."""
         self.kids.clear()
+        self._kids_by_id.clear()
         self.houses.clear()
         self.trading_blocs.clear()
         self.spatial_grid.clear()
         self.game_time = 0.0
-        self.ai_tick_timer = 0.0
+        self._ai_cursor = 0
+        self._ai_budget = 0.0
     
     def generate_map(self, layout_name: str = "default", seed: Optional[int] = None):
         """
@@ -245,6 +275,8 @@ class GameWorld:
         
         # Generate houses using map generator
         houses = map_generator.generate_map(layout_name, seed)
+        if seed is not None:
+            self.rng.seed(seed)
         
         # Add houses to world
         for house in houses:
@@ -299,23 +331,23 @@ class GameWorld:
         if len(self.kids) < 2:
             return
         
-        # Use spatial grid for efficient collision detection
-        for kid in self.kids:
-            if not kid.active:
-                continue
-            
-            # Find nearby kids using spatial grid
-            search_radius = kid.collision_radius * 3
-            top_left = Vector2(kid.position.x - search_radius, kid.position.y - search_radius)
-            bottom_right = Vector2(kid.position.x + search_radius, kid.position.y + search_radius)
-            nearby_kids = self.spatial_grid.get_entities_in_rect(top_left, bottom_right)
-            
-            # Filter to only other kids
-            other_kids = [entity for entity in nearby_kids 
-                         if isinstance(entity, type(kid)) and entity != kid and entity.active]
-            
-            # Check for collisions
-            colliding_kids = kid.check_collision_with_kids(other_kids)
+        active_kids = [kid for kid in self.kids if kid.active]
+        if len(active_kids) < 2:
+            return
+        
+        # Rebuild a kid-only grid whose cells are twice the largest collision
+        # radius, so every possible collider sits in the 3x3 neighborhood
+        grid = self.collision_grid
+        grid.clear()
+        grid.cell_size = 2 * max(kid.collision_radius for kid in active_kids)
+        if grid.cell_size <= 0:
+            return
+        for kid in active_kids:
+            grid.add(kid, kid.position)
+        
+        for kid in active_kids:
+            # Check for collisions against neighboring cells only
+            colliding_kids = kid.check_collision_with_kids(grid.get_neighborhood(kid.position))
             
             # Apply separation force
             if colliding_kids:
@@ -5,6 +5,7 @@ Manages rumor propagation through social networks and affects kid
 beliefs about candy values and market information.
 """
 
+import random
 from typing import List, Dict, Any, Optional
 from ..entities.rumor import Rumor, RumorType
 from ..entities.kid import Kid
@@ -60,13 +61,16 @@ class RumorSystem:
         Args:
             dt: Delta time in seconds
         """
-        # Update all active rumors
-        for rumor in self.active_rumors[:]:  # Copy list to avoid modification during iteration
+        # Tick every rumor and keep the survivors in a single pass; rebuilding
+        # the list in place avoids an O(n) list.remove per expired rumor
+        survivors = []
+        for rumor in self.active_rumors:
             rumor.update(dt)
-            
-            # Remove expired rumors
-            if rumor.is_expired():
-                self.active_rumors.remove(rumor)
+            if not rumor.is_expired():
+                survivors.append(rumor)
+
+        if len(survivors) != len(self.active_rumors):
+            self.active_rumors[:] = survivors
     
     def create_rumor(self, rumor_type: RumorType, target_kid: Kid, 
                     content: str = None, believability: float = 0.5) -> Rumor:
@@ -98,8 +102,6 @@ class RumorSystem:
     
     def _generate_rumor_content(self, rumor_type: RumorType, target_kid: Kid) -> str:
         """Generate rumor content from templates."""
-        import random
-        
         templates = self.rumor_templates.get(rumor_type, ["Generic rumor"])
         template = random.choice(templates)
         
@@ -131,7 +133,6 @@ class RumorSystem:
         for kid in nearby_kids:
             if rumor.can_spread_to(kid.id):
                 # Check if rumor spreads to this kid
-                import random
                 if random.random() < self.spread_chance:
                     rumor.spread_to(kid.id, self.mutation_chance)
                     self._apply_rumor_effect(rumor, kid)
@@ -94,27 +94,33 @@ class SpatialGrid:
         Returns:
             List of entities within the radius
         """
-        center_cell = self._get_cell(position)
+        center_x, center_y = self._get_cell(position)
         radius_cells = int(radius // self.cell_size) + 1
+        px, py = position.x, position.y
+        radius_sq = radius * radius
+        grid = self.grid
         
         nearby = []
         
         # Check all cells within radius
-        for dx in range(-radius_cells, radius_cells + 1):
-            for dy in range(-radius_cells, radius_cells + 1):
-                cell = (center_cell[0] + dx, center_cell[1] + dy)
+        for cx in range(center_x - radius_cells, center_x + radius_cells + 1):
+            for cy in range(center_y - radius_cells, center_y + radius_cells + 1):
+                cell = grid.get((cx, cy))
+                if not cell:
+                    continue
                 
-                if cell in self.grid:
-                    for entity in self.grid[cell]:
-                        # Get entity position (this assumes entities have a position attribute)
-                        if hasattr(entity, 'position'):
-                            entity_pos = entity.position
-                        else:
-                            # Fallback: we can't calculate distance without position
-                            continue
-                            
-                        if entity_pos.distance_to(position) <= radius:
-                            nearby.append(entity)
+                for entity in cell:
+                    # Get entity position (this assumes entities have a position attribute)
+                    entity_pos = getattr(entity, 'position', None)
+                    if entity_pos is None:
+                        # Fallback: we can't calculate distance without position
+                        continue
+                    
+                    # Squared distance check, no sqrt or temporary vectors
+                    dx = entity_pos.x - px
+                    dy = entity_pos.y - py
+                    if dx * dx + dy * dy <= radius_sq:
+                        nearby.append(entity)
         
         return nearby
     
@@ -131,6 +137,30 @@ class SpatialGrid:
         cell = self._get_cell(position)
         return self.grid.get(cell, [])
     
+    def get_neighborhood(self, position: Vector2) -> List[Any]:
+        """
+        Get all entities in the cell containing a position and its 8 neighbors.
+        
+        No distance filtering is done, so callers get a cheap candidate list.
+        With a cell size of at least twice the largest interaction radius,
+        every entity that can interact with the position is included.
+        
+        Args:
+            position: World position
+            
+        Returns:
+            List of candidate entities
+        """
+        cx, cy = self._get_cell(position)
+        grid = self.grid
+        candidates = []
+        for x in (cx - 1, cx, cx + 1):
+            for y in (cy - 1, cy, cy + 1):
+                cell = grid.get((x, y))
+                if cell:
+                    candidates.extend(cell)
+        return candidates
+    
     def get_entities_in_rect(self, top_left: Vector2, bottom_right: Vector2) -> List[Any]:
         """
         Get all entities within a rectangular area.
@@ -87,7 +87,9 @@ class Vector2:
     
     def distance_squared_to(self, other: 'Vector2') -> float:
         """Calculate squared distance to another vector (faster)."""
-        return (self - other).length_squared()
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
     
     def angle_to(self, other: 'Vector2') -> float:
         """Calculate angle to another vector in radians."""
@@ -245,6 +245,8 @@ class TestSprint1Integration:
         # Should have one less kid
         assert len(self.world.kids) == initial_kid_count - 1
         assert kid_to_remove not in self.world.kids
+        assert self.world.get_kid_by_id(kid_to_remove.id) is None
+        assert self.world.get_kid_by_id(self.world.kids[0].id) is self.world.kids[0]
     
     def test_camera_integration(self):
         """Test camera system integration."""
@@ -97,6 +97,24 @@ class TestTradingSystem:
         assert bloc.get_member_count() >= 3
         assert bloc.can_form() is True
     
+    def test_trading_bloc_fracture_keeps_most_active(self, sample_world):
+        """Test that a fracturing bloc keeps its most active traders."""
+        world = sample_world
+        world.update(0.1)
+        
+        bloc = world.trading_blocs[0]
+        first, second, third = bloc.members[:3]
+        bloc.add_member("kid_extra")
+        
+        # The later joiners trade; the first member never does
+        bloc.record_trade(third, "kid_extra", 1.0)
+        bloc.record_trade(third, second, 1.0)
+        
+        remaining = bloc.fracture()
+        
+        assert remaining == [third, second]
+        assert first not in remaining
+    
     def test_world_update_cycle(self, sample_world):
         """Test complete world update cycle."""
         world = sample_world
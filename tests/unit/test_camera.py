@@ -71,6 +71,26 @@ class TestCamera:
         assert screen_pos.x == expected_x
         assert screen_pos.y == expected_y
     
+    def test_world_to_screen_batch(self):
+        """Test batch conversion matches per-position conversion."""
+        self.camera.position = Vector2(50, -30)
+        self.camera.zoom = 1.5
+        world_positions = [Vector2(0, 0), Vector2(100, 200), Vector2(-40, 15)]
+        
+        screen_positions = self.camera.world_to_screen_batch(world_positions)
+        
+        expected = [self.camera.world_to_screen(pos).to_int_tuple() for pos in world_positions]
+        assert screen_positions == expected
+    
+    def test_world_to_screen_xy(self):
+        """Test scalar conversion matches the Vector2 conversion."""
+        self.camera.position = Vector2(50, -30)
+        self.camera.zoom = 1.5
+        
+        for pos in [Vector2(0, 0), Vector2(100, 200), Vector2(-40, 15)]:
+            screen_xy = self.camera.world_to_screen_xy(pos.x, pos.y)
+            assert screen_xy == self.camera.world_to_screen(pos).to_int_tuple()
+    
     def test_screen_to_world_conversion(self):
         """Test screen to world coordinate conversion."""
         # Test with camera at origin
@@ -254,6 +274,22 @@ class TestCamera:
         assert self.camera.zoom != 1.0  # Should have changed
         assert self.camera.zoom != target_zoom  # Should not be at target yet
     
+    def test_smooth_movement_frame_rate_independent(self):
+        """Test that smoothing covers the same ground regardless of frame rate."""
+        target = Vector2(100, 200)
+        fine = Camera()
+        fine.set_position(target, smooth=True)
+        self.camera.set_position(target, smooth=True)
+        
+        self.camera.update(0.2)
+        fine.update(0.1)
+        fine.update(0.1)
+        
+        assert abs(self.camera.position.x - fine.position.x) < 1e-6
+        assert abs(self.camera.position.y - fine.position.y) < 1e-6
+        # Target vector is never mutated by the camera
+        assert target == Vector2(100, 200)
+    
     def test_bounds_enforcement(self):
         """Test that bounds are enforced during update."""
         # Set bounds
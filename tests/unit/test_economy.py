@@ -79,6 +79,30 @@ class TestEconomy:
         price = economy.get_market_price("CHOCOLATE")
         assert price == 7.0
     
+    def test_market_price_recent_trades_weighted(self, sample_economy):
+        """Test market prices weight recent trades and track new trades."""
+        economy = sample_economy
+        
+        economy.record_trade("CHOCOLATE", 8.0, "kid1", "kid2")
+        economy.record_trade("FRUITY", 5.0, "kid2", "kid3")
+        economy.record_trade("CHOCOLATE", 7.5, "kid2", "kid3")
+        economy.record_trade("CHOCOLATE", 8.5, "kid3", "kid1")
+        economy.update(0.1)
+        
+        # Per-candy weights 1.0, 1.1, 1.2 for the three chocolate trades
+        expected = (8.0 * 1.0 + 7.5 * 1.1 + 8.5 * 1.2) / 3.3
+        assert economy.market_prices["CHOCOLATE"] == pytest.approx(expected)
+        assert economy.market_prices["FRUITY"] == pytest.approx(5.0)
+        
+        # Updating without new trades leaves prices unchanged
+        economy.update(0.1)
+        assert economy.market_prices["CHOCOLATE"] == pytest.approx(expected)
+        
+        # A new trade is picked up on the next update
+        economy.record_trade("FRUITY", 6.0, "kid1", "kid3")
+        economy.update(0.1)
+        assert economy.market_prices["FRUITY"] == pytest.approx((5.0 + 6.0 * 1.1) / 2.1)
+    
     def test_price_trend_calculation(self, sample_economy):
         """Test price trend calculation."""
         economy = sample_economy
@@ -173,3 +173,38 @@ class TestKidCollision:
         # Should find some collisions (kids close to position 100, 100)
         assert len(colliding_kids) > 0
         assert len(colliding_kids) < len(kids)  # Not all kids should collide
+
+
+class TestWorldKidCollisions:
+    """Test world-level collision handling through the kid collision grid."""
+    
+    def test_overlapping_kids_are_separated(self):
+        """Test that overlapping kids in neighboring cells push apart."""
+        from src.systems.game_world import GameWorld
+        
+        world = GameWorld()
+        kid1 = Kid("kid1", Vector2(100, 100))
+        kid2 = Kid("kid2", Vector2(115, 100))  # Overlapping, across a cell boundary
+        far_kid = Kid("far_kid", Vector2(500, 500))
+        for kid in (kid1, kid2, far_kid):
+            world.add_kid(kid)
+        
+        world._handle_kid_collisions(0.1)
+        
+        assert kid1.position.x < 100
+        assert kid2.position.x > 115
+        assert far_kid.position == Vector2(500, 500)
+    
+    def test_neighborhood_excludes_distant_cells(self):
+        """Test that the neighborhood query only returns nearby cells."""
+        from src.utils.spatial_grid import SpatialGrid
+        
+        grid = SpatialGrid(cell_size=30)
+        near = Kid("near", Vector2(40, 40))
+        far = Kid("far", Vector2(300, 300))
+        grid.add(near, near.position)
+        grid.add(far, far.position)
+        
+        candidates = grid.get_neighborhood(Vector2(10, 10))
+        assert near in candidates
+        assert far not in candidates
@@ -3,6 +3,7 @@ Unit tests for Kid entity.
 """
 
 import pytest
+from src.entities.base_entity import BaseEntity
 from src.entities.kid import Kid, KidState, PersonalityType, Mood
 from src.utils.vector2 import Vector2
 
@@ -46,6 +47,21 @@ class TestKidEntity:
         assert reached
         assert self.kid.position.distance_to(target) <= 10.0  # Arrival distance
     
+    def test_move_toward_arrival_does_not_mutate_shared_vectors(self):
+        """Test that snapping to the target leaves caller vectors untouched."""
+        spawn = Vector2(0, 0)
+        velocity = Vector2(5, 0)
+        entity = BaseEntity("spawned_entity", spawn)
+        entity.set_velocity(velocity)
+        target = Vector2(1, 0)
+        
+        assert entity.move_toward(target, 100.0, 1.0)
+        assert entity.position == target
+        assert entity.position is not target
+        assert entity.velocity == Vector2(0, 0)
+        assert spawn == Vector2(0, 0)
+        assert velocity == Vector2(5, 0)
+    
     def test_reached_target(self):
         """Test reached_target detection."""
         # Set target far away
@@ -113,6 +129,19 @@ class TestKidEntity:
         assert self.kid.current_path == []
         assert self.kid.path_index == 0
     
+    def test_set_path_does_not_hold_shared_path(self):
+        """Test that a kid's path is its own copy, reused across repaths."""
+        shared = [Vector2(100, 100), Vector2(150, 150)]
+        own_list = self.kid.current_path
+        self.kid.set_path(shared)
+        
+        # Clearing or replacing the kid's path leaves the shared list intact
+        self.kid.set_path([Vector2(10, 10)])
+        self.kid.clear_path()
+        
+        assert shared == [Vector2(100, 100), Vector2(150, 150)]
+        assert self.kid.current_path is own_list
+    
     def test_mood_color_mapping(self):
         """Test mood to color mapping."""
         # Test different moods
@@ -244,3 +273,14 @@ class TestKidStateMachine:
         
         # Should transition to IDLE
         assert self.kid.state == KidState.IDLE
+    
+    def test_recent_trades_bounded(self):
+        """Test that recent trades keep only the newest entries."""
+        from src.entities.kid import RECENT_TRADES_LIMIT
+        
+        for i in range(RECENT_TRADES_LIMIT + 5):
+            self.kid.recent_trades.append({"partner": f"kid_{i}", "offer": {}, "request": {}})
+        
+        assert len(self.kid.recent_trades) == RECENT_TRADES_LIMIT
+        assert self.kid.recent_trades[0]["partner"] == "kid_5"
+        assert self.kid.recent_trades[-1]["partner"] == f"kid_{RECENT_TRADES_LIMIT + 4}"
@@ -241,6 +241,40 @@ class TestPathfinder:
         assert path2 is not None
         assert path1 == path2  # Should be identical
     
+    def test_path_cache_keyed_by_cell(self):
+        """Test that positions in the same cells share a cached path."""
+        path1 = self.pathfinder.find_path(Vector2(10, 10), Vector2(30, 30))
+        path2 = self.pathfinder.find_path(Vector2(12, 14), Vector2(33, 36))
+        assert path2 is path1
+    
+    def test_path_cache_cleared_on_obstacle_update(self):
+        """Test that updating obstacles invalidates cached paths."""
+        self.pathfinder.find_path(Vector2(10, 10), Vector2(30, 30))
+        assert self.pathfinder.path_cache
+        
+        self.pathfinder.update_obstacles([])
+        assert not self.pathfinder.path_cache
+    
+    def test_path_replanned_after_grid_obstacle_change(self):
+        """Test that adding or removing obstacles invalidates cached paths."""
+        start = Vector2(10, 10)  # Cell (0,0)
+        end = Vector2(50, 50)    # Cell (2,2)
+        path1 = self.pathfinder.find_path(start, end)
+        assert any(self.grid.world_to_grid(p) == (1, 1) for p in path1)
+        
+        # Block the direct route; the cached path must not be reused
+        self.grid.add_obstacle(Vector2(30, 30), 15)  # Block cell (1,1)
+        path2 = self.pathfinder.find_path(start, end)
+        assert path2 is not path1
+        for waypoint in path2:
+            assert self.grid.is_walkable(*self.grid.world_to_grid(waypoint))
+        
+        # Wall off the goal, then reopen it; the cached miss must not stick
+        self.grid.add_obstacle(end, 30)
+        assert self.pathfinder.find_path(start, end) is None
+        self.grid.remove_obstacle(end, 30)
+        assert self.pathfinder.find_path(start, end) is not None
+    
     def test_heuristic_calculation(self):
         """Test heuristic distance calculation."""
         node1 = self.grid.grid[0][0]  # (0,0)
@@ -107,6 +107,172 @@ class TestRendererColorClamping:
         
         assert no_crash
     
+    def test_glow_surfaces_are_cached_by_clamped_key(self):
+        """Test that glow surfaces are reused for equivalent clamped inputs."""
+        from src.rendering.safe_draw import get_glow_surface
+        
+        surface = get_glow_surface((300, -5, 0), [(500, 6), (100, 10)])
+        
+        assert surface is get_glow_surface((255, 0, 0), [(100, 10), (255, 6)])
+        assert surface.get_size() == (24, 24)
+    
+    def test_glow_layers_composite_like_stacked_blits(self):
+        """Test that a baked glow matches its layers blitted one by one."""
+        from src.rendering.safe_draw import get_glow_surface
+        layers = [(80, 6), (55, 8), (30, 10)]
+        stacked = pygame.Surface((24, 24))
+        stacked.fill((30, 60, 90))
+        for alpha, radius in layers:
+            layer = pygame.Surface((24, 24), pygame.SRCALPHA)
+            pygame.draw.circle(layer, (255, 50, 50), (12, 12), radius)
+            layer.set_alpha(alpha)
+            stacked.blit(layer, (0, 0))
+        
+        baked = pygame.Surface((24, 24))
+        baked.fill((30, 60, 90))
+        baked.blit(get_glow_surface((255, 50, 50), layers), (0, 0))
+        
+        for point in [(12, 12), (12, 5), (12, 3), (0, 0)]:
+            for got, expected in zip(baked.get_at(point), stacked.get_at(point)):
+                assert abs(got - expected) <= 2
+    
+    def teardown_method(self):
+        """Clean up after tests."""
+        pygame.quit()
+
+
+class TestRendererCulling:
+    """Test that entities outside the view are not drawn."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        pygame.init()
+        self.screen = pygame.Surface((1000, 1000))
+        self.renderer = Renderer(self.screen)
+        self.world = GameWorld()
+        self.renderer.current_world = self.world
+    
+    def test_offscreen_kids_are_culled(self):
+        """Test that only kids near the view reach _render_kid."""
+        camera = self.renderer.camera
+        on_screen = Kid("on_screen", Vector2(camera.position.x, camera.position.y))
+        off_screen = Kid("off_screen", Vector2(camera.position.x + 100000, camera.position.y))
+        self.world.add_kid(on_screen)
+        self.world.add_kid(off_screen)
+        
+        rendered = []
+        self.renderer._render_kid = rendered.append
+        self.renderer._render_entities(self.world)
+        
+        assert rendered == [on_screen]
+    
+    def test_offscreen_houses_are_culled(self):
+        """Test that only houses near the view reach _render_house."""
+        camera = self.renderer.camera
+        on_screen = House("on_screen", Vector2(camera.position.x, camera.position.y))
+        off_screen = House("off_screen", Vector2(camera.position.x, camera.position.y - 100000))
+        self.world.add_house(on_screen)
+        self.world.add_house(off_screen)
+        
+        rendered = []
+        self.renderer._render_house = rendered.append
+        self.renderer._render_entities(self.world)
+        
+        assert rendered == [on_screen]
+    
+    def test_trading_bloc_connections_are_drawn(self):
+        """Test that batched bloc outlines reach the screen."""
+        from src.entities.trading_bloc import TradingBloc
+        camera = self.renderer.camera
+        left = Kid("left", Vector2(camera.position.x - 100, camera.position.y))
+        right = Kid("right", Vector2(camera.position.x + 100, camera.position.y))
+        self.world.add_kid(left)
+        self.world.add_kid(right)
+        bloc = TradingBloc("bloc_test")
+        bloc.add_member(left.id)
+        bloc.add_member(right.id)
+        self.world.trading_blocs.append(bloc)
+        
+        self.renderer._render_kid = lambda kid: None
+        self.renderer._render_entities(self.world)
+        
+        midpoint = camera.world_to_screen_xy(camera.position.x, camera.position.y)
+        assert tuple(self.screen.get_at(midpoint))[:3] == bloc.color
+    
+    def test_offscreen_trading_bloc_is_culled(self):
+        """Test that a bloc whose members are all off screen adds no lines."""
+        from src.entities.trading_bloc import TradingBloc
+        camera = self.renderer.camera
+        near = Kid("near", Vector2(camera.position.x + 100000, camera.position.y))
+        far = Kid("far", Vector2(camera.position.x + 100500, camera.position.y))
+        bloc = TradingBloc("bloc_test")
+        bloc.add_member(near.id)
+        bloc.add_member(far.id)
+        
+        outlines_by_color = {}
+        self.renderer._render_trading_bloc(bloc, {near.id: near, far.id: far}, outlines_by_color)
+        
+        assert outlines_by_color == {}
+    
+    def teardown_method(self):
+        """Clean up after tests."""
+        pygame.quit()
+
+
+class TestRendererTextCache:
+    """Test caching of rendered text surfaces."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        pygame.init()
+        self.screen = pygame.Surface((1000, 1000))
+        self.renderer = Renderer(self.screen)
+    
+    def test_text_surface_is_reused(self):
+        """Test that the same label is rasterized only once."""
+        first = self.renderer._get_text_surface("kid_1", 12, (255, 255, 255))
+        second = self.renderer._get_text_surface("kid_1", 12, (255, 255, 255))
+        
+        assert first is second
+        assert len(self.renderer.text_cache) == 1
+    
+    def test_text_cache_is_bounded(self):
+        """Test that the oldest text surfaces are evicted once the cache is full."""
+        from src.rendering.renderer import TEXT_CACHE_SIZE
+        
+        for i in range(TEXT_CACHE_SIZE + 10):
+            self.renderer._get_text_surface(f"{i}", 10, (255, 255, 255))
+        
+        assert len(self.renderer.text_cache) == TEXT_CACHE_SIZE
+        assert ("0", 10, (255, 255, 255)) not in self.renderer.text_cache
+    
+    def teardown_method(self):
+        """Clean up after tests."""
+        pygame.quit()
+
+
+class TestRendererDebugOverlay:
+    """Test the debug overlay's use of the game clock."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        pygame.init()
+        self.screen = pygame.Surface((1000, 1000))
+        self.world = GameWorld()
+    
+    def test_fps_comes_from_supplied_clock(self):
+        """Test that the overlay reads the game's clock without ticking it."""
+        from unittest.mock import MagicMock
+        clock = MagicMock()
+        clock.get_fps.return_value = 60.0
+        renderer = Renderer(self.screen, clock)
+        renderer.debug_enabled = True
+        
+        renderer.render_world(self.world)
+        
+        clock.get_fps.assert_called()
+        clock.tick.assert_not_called()
+    
     def teardown_method(self):
         """Clean up after tests."""
         pygame.quit()
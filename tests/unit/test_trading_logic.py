@@ -6,6 +6,7 @@ and basic trading AI behavior.
 """
 
 import pytest
+from unittest.mock import patch
 from src.entities.kid import Kid, PersonalityType, Mood, KidState
 from src.systems.economy import Economy
 from src.core.candy_types import CandyTypes
@@ -208,3 +209,38 @@ class TestTradingAI:
         nearby = self.world.spatial_grid.get_nearby(self.kid1.position, 150.0)
         kid_types = [k for k in nearby if isinstance(k, Kid) and k != self.kid1]
         assert len(kid_types) > 0
+    
+    def test_last_partner_tried_before_neighborhood_scan(self):
+        """Test that a still-viable last partner is reused without a grid query."""
+        from src.ai.basic_behaviors import BasicBehaviors
+        
+        self.kid1.last_trade_partner = self.kid2
+        self.world.spatial_grid.clear()  # A neighborhood scan would find nobody
+        self.kid1.state = KidState.SEEKING_TRADE
+        
+        partners = []
+        original = Kid.evaluate_trade
+        def record(partner, offer, request, economy):
+            partners.append(partner)
+            return original(partner, offer, request, economy)
+        
+        with patch.object(Kid, 'evaluate_trade', autospec=True, side_effect=record):
+            BasicBehaviors.attempt_trade(self.kid1, self.world)
+        
+        assert partners == [self.kid2]
+        assert self.kid1.state == KidState.IDLE
+    
+    def test_unviable_last_partner_is_skipped(self):
+        """Test that a partner who has moved out of range is not reused."""
+        from src.ai.basic_behaviors import BasicBehaviors
+        
+        self.kid2.position = Vector2(1000, 1000)
+        self.kid1.last_trade_partner = self.kid2
+        self.world._update_spatial_grid()
+        self.kid1.state = KidState.SEEKING_TRADE
+        
+        BasicBehaviors.attempt_trade(self.kid1, self.world)
+        
+        # Nobody in range, so the kid gives up without trading
+        assert self.kid1.state == KidState.IDLE
+        assert self.kid1.inventory == {"CHOCOLATE": 5, "FRUITY": 3}